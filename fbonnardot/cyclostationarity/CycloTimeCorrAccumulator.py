@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 16 19:48:30 2026
+
+@author: Frédéric BONNARDOT, AGPL-3.0-or-later license
+(c) Frédéric BONNARDOT, 2001-2026
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+This code is given as is without warranty of any kind.
+In no event shall the authors or copyright holder be liable for any claim
+                                                   damages or other liability.
+
+If you change or adapt this function, change its name (for example add your
+                                                       initial after the name)
+"""
+
+import numpy as np                       # matrix management
+from fbonnardot.cyclostationarity.cycloTimeCorr import lagBlockSums
+
+class CycloTimeCorrAccumulator:
+    """
+    Incremental temporal (inter)-correlation Rxy(t,tau) of signals given by chunks.
+
+    The products x(n)*conj(y(n+d)) are added to the phase (n-origin)%period
+    as soon as y(n+d) is available : the last max(vect_tau) samples are kept
+    until the next chunk so the lags that straddle two chunks are computed.
+    Accumulators of different parts of a signal can be merged.
+
+    Example
+    -------
+    >>> import fbonnardot as fb; import numpy as np
+    >>> per=12; N=1000*per; tau=np.arange(0,20,2)
+    >>> data=np.sin(2*np.pi/per*np.arange(N))*np.random.randn(N)
+    >>> acc=fb.CycloTimeCorrAccumulator(per,tau)
+    >>> for chunk in np.array_split(data,10):
+    >>>     acc.update(chunk,chunk)
+    >>> Rxx=acc.Rxy
+
+    Split of a signal between 2 workers (same result as 1 accumulator) :
+
+    >>> n1=N//2; dmax=np.max(tau)
+    >>> acc1=fb.CycloTimeCorrAccumulator(per,tau,stop=n1)
+    >>> acc1.update(data[0:n1+dmax],data[0:n1+dmax])
+    >>> acc2=fb.CycloTimeCorrAccumulator(per,tau,first=n1)
+    >>> acc2.update(data[n1:],data[n1:])
+    >>> Rxx=acc1.merge(acc2).Rxy
+
+    Note
+    ----
+    * Same conventions as cycloTimeCorr : delay d=2*(tau//2) between x and y
+      and origin=1 by default (Rxy[0] is computed from the sample 1).
+    * cycloTimeCorr uses the same number of blocs for all the phases of a lag
+      (complete blocs only) while the accumulator uses all the available
+      products (the number of products can differ by 1 between phases).
+    * The memory used is O(period x len(vect_tau)+max(vect_tau)).
+    """
+    # Creation      : Friday 16 October 2026
+    # Version       : 1.0 i
+
+    def __init__(self,period,vect_tau,first=0,stop=None,origin=1):
+        """
+        Create an empty accumulator
+
+        Parameters
+        ----------
+        period : int
+            cyclic period of the signal to consider
+
+        vect_tau : vector
+            delays (lag) for computing (even positive integers)
+
+        first : int, optional
+            index of the first sample that will be given to update
+            optional, 0 by default
+
+        stop : int, optional
+            products x(n)*conj(y(n+d)) with n>=stop are ignored (the samples
+            after stop are only used as delayed samples y(n+d))
+            optional, None by default (no limit)
+
+        origin : int, optional
+            index of a sample of phase 0
+            optional, 1 by default (same as cycloTimeCorr)
+        """
+        self.period=int(period)
+        self.vect_tau=np.asarray(vect_tau)
+        self.d=2*(np.asarray(vect_tau,dtype=int)//2)
+        if np.any(self.d<0):
+            raise ValueError('Delays must be positive.')
+        self.dmax=int(np.max(self.d))
+        self.first=first
+        self.stop=stop
+        self.origin=origin
+        self.reset()
+
+    def reset(self):
+        """
+        Forget all the datas given to the accumulator
+        """
+        self.sums=np.zeros((self.period,len(self.d)))
+        self.counts=np.zeros((self.period,len(self.d)),dtype=int)
+        self.done=self.first    # products of all lags computed for n<done
+        self.end=self.first     # index of the next sample
+        self.restx=None         # samples done to end-1 of x and y
+        self.resty=None
+
+    def update(self,x,y):
+        """
+        Add a new chunk of signals
+
+        Parameters
+        ----------
+        x,y : vector
+            next samples of x and y (same size, any length)
+        """
+        x=np.asarray(x); y=np.asarray(y)
+        if len(x)!=len(y):
+            raise ValueError ("x and y must have the same size")
+
+        if self.restx is not None:
+            x=np.concatenate((self.restx,x))
+            y=np.concatenate((self.resty,y))
+        base=self.done          # index of x[0]
+        self.end=base+len(x)
+
+        # Products available for all the lags : n in [done;last[
+        last=self.end-self.dmax
+        if self.stop is not None:
+            last=max(self.done,min(last,self.stop))
+        if last>self.done:
+            self.addProducts(x,y,last-self.done)
+
+        keep=max(self.done,self.end-self.dmax)
+        self.restx=np.array(x[keep-base:])
+        self.resty=np.array(y[keep-base:])
+        self.done=keep
+
+    def addProducts(self,x,y,nb):
+        """
+        Add the products of the nb first samples of x (done is the index of x[0])
+        for all lags
+        """
+        P=self.period
+        shift=(self.done-self.origin) % P
+        # Zeros before (phase alignment, lagBlockSums begins at index 1)
+        # and after (complete blocs for all lags)
+        size=1+shift+nb
+        size=size+(-(size-1)) % P+self.dmax
+        xp=np.zeros(size,dtype=x.dtype); yp=np.zeros(size,dtype=y.dtype)
+        xp[1+shift:1+shift+nb]=x[0:nb]
+        yp[1+shift:1+shift+nb+self.dmax]=y[0:nb+self.dmax]
+        for index,sums,nbBlocs in lagBlockSums(xp,yp,P,self.vect_tau,stage=None):
+            self.sums=self.sums.astype(np.result_type(self.sums,sums),copy=False)
+            self.sums[:,index]+=sums
+        self.counts+=phaseCounts(self.done,self.done+nb,P,self.origin)[:,np.newaxis]
+        self.done+=nb
+
+    def tail(self):
+        """
+        Sums and counts of the products of the kept samples (n>=done) for the
+        lags d such as n+d<end (not yet added to sums and counts)
+        """
+        sums=np.zeros(self.sums.shape,dtype=self.sums.dtype)
+        counts=np.zeros(self.counts.shape,dtype=int)
+        if self.restx is None:
+            return sums,counts
+        for lag in range(len(self.d)):
+            last=self.end-self.d[lag]
+            if self.stop is not None:
+                last=min(last,self.stop)
+            nb=last-self.done
+            if nb<=0:
+                continue
+            prod=self.restx[0:nb]*np.conj(self.resty[self.d[lag]:self.d[lag]+nb])
+            phase=(np.arange(self.done,last)-self.origin) % self.period
+            sums=sums.astype(np.result_type(sums,prod),copy=False)
+            np.add.at(sums[:,lag],phase,prod)
+            counts[:,lag]+=phaseCounts(self.done,last,self.period,self.origin)
+        return sums,counts
+
+    def merge(self,other):
+        """
+        Add the products of another accumulator (other part of the signal)
+
+        The kept samples of other are used (self keeps its own kept samples,
+        so it can be updated after the merge).
+
+        Parameters
+        ----------
+        other : CycloTimeCorrAccumulator
+            accumulator with the same period, delays and origin
+
+        Returns
+        -------
+        self : CycloTimeCorrAccumulator
+        """
+        if (other.period!=self.period or other.origin % self.period!=self.origin % self.period
+                or not np.array_equal(other.d,self.d)):
+            raise ValueError('Only accumulators with the same period, delays and origin can be merged.')
+
+        sums,counts=other.tail()
+        self.sums=self.sums+other.sums+sums
+        self.counts=self.counts+other.counts+counts
+        return self
+
+    @property
+    def Rxy(self):
+        """
+        Estimated correlation Rxy(t,tau) (matrix period x len(vect_tau))
+        """
+        sums,counts=self.tail()
+        counts=counts+self.counts
+        if np.any(counts==0):
+            raise ValueError('The signals must contain at least 1 period for each lag.')
+        return (self.sums+sums)/counts
+
+def phaseCounts(start,stop,period,origin):
+    """
+    Number of samples n in [start;stop[ of each phase (n-origin)%period
+    """
+    phase=np.arange(period)
+    # First sample of each phase
+    n0=start+(phase+origin-start) % period
+    return np.maximum(0,(stop-n0+period-1)//period)
+
+# Auto-test if Python script launched from console ---------------------------
+if __name__ == '__main__':
+    from fbonnardot.cyclostationarity.cycloTimeCorr import cycloTimeCorr
+    print("Auto-test if Python script launched from console")
+    print("The signal is given by random length chunks, then split between")
+    print("3 accumulators that are merged. Differences with cycloTimeCorr")
+    print("(computed on complete blocs) should be close to 0.")
+
+    # cycloTimeCorr uses the samples 1 to 1+nbBlocs*per (1000 blocs here
+    # for all lags since max(tau)<per)
+    per=12; N=1000*per+per; tau=np.arange(0,12,2)
+    data=np.sin(2*np.pi/per*np.arange(N))*np.random.randn(N)
+    data=data+1j*np.random.randn(N)
+    Rxx=cycloTimeCorr(data,data,per,tau)
+    last=1+1000*per
+
+    acc=CycloTimeCorrAccumulator(per,tau,first=1,stop=last)
+    cuts=np.sort(np.random.randint(1,N,20))
+    for chunk in np.split(data[1:],cuts-1):
+        acc.update(chunk,chunk)
+    print("Chunks :",np.max(np.abs(acc.Rxy-Rxx)))
+
+    cuts=[1,3001,7777,last]
+    accs=[]
+    for part in range(3):
+        start=cuts[part]; stop=cuts[part+1]
+        acc=CycloTimeCorrAccumulator(per,tau,first=start,stop=stop)
+        acc.update(data[start:stop+np.max(tau)],data[start:stop+np.max(tau)])
+        accs.append(acc)
+    merged=accs[0].merge(accs[1]).merge(accs[2])
+    print("Merged :",np.max(np.abs(merged.Rxy-Rxx)))
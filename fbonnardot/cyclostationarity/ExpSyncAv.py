@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 16 15:31:55 2026
+
+@author: Frédéric BONNARDOT, AGPL-3.0-or-later license
+(c) Frédéric BONNARDOT, 2001-2026
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+This code is given as is without warranty of any kind.
+In no event shall the authors or copyright holder be liable for any claim
+                                                   damages or other liability.
+
+If you change or adapt this function, change its name (for example add your
+                                                       initial after the name)
+"""
+
+import numpy as np                       # matrix management
+from fbonnardot.cyclostationarity.SyncAvAccumulator import SyncAvAccumulator
+
+class ExpSyncAv(SyncAvAccumulator):
+    """
+    Exponentially weighted synchronous average of signals given by chunks.
+
+    Each new bloc (revolution) x updates the average with a forgetting factor :
+    sav=sav+alpha*(x-sav) with alpha=1-exp(-1/tau), so a bloc received
+    tau blocs ago has a weight divided by e. Each update costs O(blocSize).
+
+    Example
+    -------
+    >>> import fbonnardot as fb; import numpy as np
+    >>> period=128; ewsa=fb.ExpSyncAv(period,tau=50,variance=True)
+    >>> for rev in range(1000):
+    >>>     amp=1+(rev>500)       # amplitude change after 500 revolutions
+    >>>     ewsa.update(amp*np.sin(2*np.pi*np.arange(period)/period)+np.random.randn(period)*0.1)
+    >>> sav,var=ewsa.sav,ewsa.var
+
+    Note
+    ----
+    * Chunks have any length (see SyncAvAccumulator), 1 signal = 1 row.
+    * Several shafts with the same period can be tracked by one object
+      (1 row per shaft).
+    * The first bloc initializes the average (its variance is 0).
+    * Complex signals are allowed (the variance is the one of |x-sav|).
+    """
+    # Creation      : Friday 16 October 2026
+    # Modifications : Friday 16 October 2026 (reset of SyncAvAccumulator called, complex signals)
+    # Version       : 1.1 i
+
+    def __init__(self,blocSize,tau,variance=False):
+        """
+        Create an empty exponentially weighted average
+
+        Parameters
+        ----------
+        blocSize : int
+            size of a block (period in samples)
+
+        tau : float
+            time constant in number of blocs
+
+        variance : bool, optional
+            if True, the exponentially weighted variance of each sample of the
+            period is also updated
+            optional, False by default
+        """
+        if tau<=0:
+            raise ValueError('tau must be strictly positive.')
+
+        self.tau=tau
+        self.alpha=1-np.exp(-1/tau)
+        SyncAvAccumulator.__init__(self,blocSize,variance)
+
+    def reset(self):
+        """
+        Forget all the datas given to the average
+        """
+        SyncAvAccumulator.reset(self)
+        self.count=0
+        self.mean=None    # exponentially weighted mean of each phase
+        self.ewvar=None   # exponentially weighted variance of each phase
+
+    def addBlocs(self,blocs):
+        """
+        Add complete blocs (already split), oldest first
+
+        Parameters
+        ----------
+        blocs : np.array (nb_sig x) nb x blocSize
+            blocs to add
+        """
+        alpha=self.alpha
+        for index in range(blocs.shape[-2]):
+            bloc=blocs[...,index,:]
+            if self.mean is None:
+                self.mean=np.array(bloc,dtype=np.result_type(bloc,float))
+                if self.variance:
+                    self.ewvar=np.zeros(np.shape(self.mean))
+            else:
+                diff=bloc-self.mean
+                incr=alpha*diff
+                self.mean+=incr
+                if self.variance:
+                    self.ewvar=(1-alpha)*(self.ewvar+alpha*np.abs(diff)**2)
+            self.count+=1
+
+    @property
+    def nbBlocs(self):
+        """
+        Number of blocs received
+        """
+        return self.count
+
+    @property
+    def sav(self):
+        """
+        Exponentially weighted synchronous average of each signals
+        """
+        if self.count==0:
+            raise ValueError('The datas must have at least 1 blocs.')
+        return self.mean
+
+    @property
+    def var(self):
+        """
+        Exponentially weighted variance of each sample of the period
+        """
+        if not self.variance:
+            raise ValueError('Create the average with variance=True.')
+        if self.count==0:
+            raise ValueError('The datas must have at least 1 blocs.')
+        return self.ewvar
+
+# Auto-test if Python script launched from console ---------------------------
+if __name__ == '__main__':
+    import matplotlib.pyplot as plt
+    print("Auto-test if Python script launched from console")
+    print("The amplitude of a sine is doubled after 500 revolutions.")
+    print("The figure shows the maximum of the average (should go from 1 to 2")
+    print("with a time constant of 50 revolutions) and the noise variance (0.01).")
+
+    period=128
+    ewsa=ExpSyncAv(period,tau=50,variance=True)
+    maxi=[]; var=[]
+    for rev in range(1000):
+        amp=1+(rev>=500)
+        ewsa.update(amp*np.sin(2*np.pi*np.arange(period)/period)+np.random.randn(period)*0.1)
+        maxi.append(np.max(ewsa.sav))
+        var.append(np.mean(ewsa.var))
+
+    plt.figure()
+    plt.subplot(2,1,1); plt.plot(maxi); plt.ylabel('max(sav)')
+    plt.subplot(2,1,2); plt.plot(var); plt.ylabel('mean(var)'); plt.xlabel('revolution')
+    plt.show()
+    print("Max after 1000 revolutions :",maxi[-1]," variance :",var[-1])
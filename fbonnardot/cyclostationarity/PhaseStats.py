@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 16 14:48:09 2026
+
+@author: Frédéric BONNARDOT, AGPL-3.0-or-later license
+(c) Frédéric BONNARDOT, 2001-2026
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+This code is given as is without warranty of any kind.
+In no event shall the authors or copyright holder be liable for any claim
+                                                   damages or other liability.
+
+If you change or adapt this function, change its name (for example add your
+                                                       initial after the name)
+"""
+
+import numpy as np                       # matrix management
+
+class PhaseStats:
+    """
+    Statistics (up to the 4th order) of each sample (phase) of a period.
+
+    The statistics are updated bloc by bloc with the mean and the sums of
+    powers of deviations (M2, M3, M4) so they are computed in one pass and
+    two PhaseStats computed on different parts of a signal can be merged.
+
+    Example
+    -------
+    >>> import fbonnardot as fb; import numpy as np
+    >>> period=100; N=1000*period
+    >>> sig=np.sin(2*np.pi*np.arange(N)/period)*np.random.randn(N)
+    >>> stats=fb.PhaseStats(period)
+    >>> stats.update(np.reshape(sig,(-1,period)))
+    >>> kurt=stats.kurtosis   # cyclic kurtosis
+
+    Note
+    ----
+    * Blocs are given as a (nb_sig x) nbBlocs x period array.
+    * Complex blocs (analytic signals) are allowed up to the 2nd order : the
+      variance is mean(|x-mean|**2) (same as np.var).
+    * Formulas of P. Pébay, "Formulas for robust, one-pass parallel computation
+      of covariances and arbitrary-order statistical moments", Sandia report
+      SAND2008-6212, 2008.
+    """
+    # Creation      : Friday 16 October 2026
+    # Modifications : Friday 16 October 2026 (complex blocs : variance of |x-mean|)
+    # Version       : 1.1 i
+
+    def __init__(self,period,order=4):
+        """
+        Create empty statistics
+
+        Parameters
+        ----------
+        period : int
+            number of samples of a bloc
+
+        order : int, optional
+            highest order computed (1 to 4), lower orders need less computing
+            optional, 4 by default
+        """
+        if order<1 or order>4:
+            raise ValueError('Limited to 4th order statistics.')
+
+        self.period=int(period)
+        self.order=order
+        self.nbBlocs=0
+        self.mean=None
+        self.m=[None]*(order+1)   # m[k] : sum of (x-mean)**k for k>=2
+
+    def update(self,blocs):
+        """
+        Add blocs
+
+        Parameters
+        ----------
+        blocs : np.array (nb_sig x) nbBlocs x period
+            blocs to add
+
+        Returns
+        -------
+        self : PhaseStats
+        """
+        blocs=np.asarray(blocs)
+        if blocs.shape[-1]!=self.period:
+            raise ValueError('The blocs must have period samples.')
+        if np.iscomplexobj(blocs) and self.order>=3:
+            raise ValueError('Complex blocs are limited to 2nd order statistics (order<=2).')
+
+        other=PhaseStats(self.period,self.order)
+        other.nbBlocs=blocs.shape[-2]
+        if other.nbBlocs==0:
+            return self
+        other.mean=np.mean(blocs,-2)
+        if self.order>=2:
+            dev=blocs-other.mean[...,np.newaxis,:]
+            dev2=(dev*np.conj(dev)).real
+            other.m[2]=np.sum(dev2,-2)
+            if self.order>=3:
+                other.m[3]=np.sum(dev2*dev,-2)
+            if self.order>=4:
+                other.m[4]=np.sum(dev2*dev2,-2)
+
+        return self.merge(other)
+
+    def merge(self,other):
+        """
+        Merge the statistics of other (computed on other blocs) in self
+
+        Parameters
+        ----------
+        other : PhaseStats
+            statistics with the same period and order
+
+        Returns
+        -------
+        self : PhaseStats
+        """
+        if other.period!=self.period or other.order!=self.order:
+            raise ValueError('Only statistics with the same period and order can be merged.')
+
+        if other.nbBlocs==0:
+            return self
+
+        if self.nbBlocs==0:
+            self.nbBlocs=other.nbBlocs
+            self.mean=np.copy(other.mean)
+            self.m=[None if mk is None else np.copy(mk) for mk in other.m]
+            return self
+
+        na=self.nbBlocs; nb=other.nbBlocs; n=na+nb
+        delta=other.mean-self.mean
+        ma=self.m; mb=other.m
+
+        # The higher orders use the lower orders before update
+        if self.order>=4:
+            m4=(ma[4]+mb[4]+delta**4*(na*nb*(na*na-na*nb+nb*nb)/n**3)
+                +6*delta**2*(na*na*mb[2]+nb*nb*ma[2])/n**2
+                +4*delta*(na*mb[3]-nb*ma[3])/n)
+        if self.order>=3:
+            m3=(ma[3]+mb[3]+delta**3*(na*nb*(na-nb)/n**2)
+                +3*delta*(na*mb[2]-nb*ma[2])/n)
+        if self.order>=2:
+            m2=ma[2]+mb[2]+np.abs(delta)**2*(na*nb/n)
+
+        if self.order>=2:
+            ma[2]=m2
+        if self.order>=3:
+            ma[3]=m3
+        if self.order>=4:
+            ma[4]=m4
+        self.mean=self.mean+delta*(nb/n)
+        self.nbBlocs=n
+
+        return self
+
+    def central(self,k):
+        """
+        Central moment of order k of each phase : mean((x-mean)**k)
+        """
+        self.check(k)
+        if k==1:
+            return np.zeros(np.shape(self.mean))
+        return self.m[k]/self.nbBlocs
+
+    def moment(self,k):
+        """
+        Moment of order k of each phase : mean(x**k) (mean(|x|**2) for k=2)
+        """
+        self.check(k)
+        mu=self.mean
+        if k==1:
+            return mu
+        c2=self.central(2)
+        if k==2:
+            return c2+np.abs(mu)**2
+        c3=self.central(3)
+        if k==3:
+            return c3+3*mu*c2+mu**3
+        return self.central(4)+4*mu*c3+6*mu**2*c2+mu**4
+
+    def cumulant(self,k):
+        """
+        Cumulant of order k of each phase
+        """
+        self.check(k)
+        if k==1:
+            return self.mean
+        if k==4:
+            return self.central(4)-3*self.central(2)**2
+        return self.central(k)
+
+    @property
+    def var(self):
+        """
+        Variance of each phase (np.var convention : divided by nbBlocs)
+        """
+        return self.central(2)
+
+    @property
+    def skewness(self):
+        """
+        Skewness of each phase
+        """
+        return self.central(3)/self.central(2)**1.5
+
+    @property
+    def kurtosis(self):
+        """
+        Kurtosis of each phase (3 for a Gaussian signal)
+        """
+        return self.central(4)/self.central(2)**2
+
+    def check(self,k):
+        """
+        Check that the order k is available
+        """
+        if k<1 or k>self.order:
+            raise ValueError('Order '+str(k)+' not computed (order='+str(self.order)+').')
+        if self.nbBlocs==0:
+            raise ValueError('The datas must have at least 1 blocs.')
+
+# Auto-test if Python script launched from console ---------------------------
+if __name__ == '__main__':
+    print("Auto-test if Python script launched from console")
+    print("Statistics are computed on 2 parts of a signal and merged.")
+    print("The differences with a direct computation should be close to 0.")
+
+    period=100; N=1000*period
+    sig=np.sin(2*np.pi*np.arange(N)/period)*np.random.randn(N)+0.1*np.random.randn(N)
+    blocs=np.reshape(sig,(-1,period))
+
+    stats=PhaseStats(period).update(blocs[0:300])
+    stats.merge(PhaseStats(period).update(blocs[300:]))
+
+    mean=np.mean(blocs,0); dev=blocs-mean
+    print("Mean      :",np.max(np.abs(stats.mean-mean)))
+    print("Variance  :",np.max(np.abs(stats.var-np.var(blocs,0))))
+    print("Moment 3  :",np.max(np.abs(stats.moment(3)-np.mean(blocs**3,0))))
+    print("Moment 4  :",np.max(np.abs(stats.moment(4)-np.mean(blocs**4,0))))
+    print("Kurtosis  :",np.max(np.abs(stats.kurtosis-np.mean(dev**4,0)/np.var(blocs,0)**2)))
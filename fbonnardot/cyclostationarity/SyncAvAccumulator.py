@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 16 09:12:40 2026
+
+@author: Frédéric BONNARDOT, AGPL-3.0-or-later license
+(c) Frédéric BONNARDOT, 2001-2026
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+This code is given as is without warranty of any kind.
+In no event shall the authors or copyright holder be liable for any claim
+                                                   damages or other liability.
+
+If you change or adapt this function, change its name (for example add your
+                                                       initial after the name)
+"""
+
+import numpy as np                       # matrix management
+from fbonnardot.cyclostationarity.PhaseStats import PhaseStats
+
+class SyncAvAccumulator:
+    """
+    Incremental synchronous average of one or more signals given by chunks.
+
+    The chunks can have any length : the samples of an incomplete period are
+    kept until the next chunk, so the memory used is O(blocSize) whatever
+    the total length of the signal.
+
+    Example
+    -------
+    >>> import fbonnardot as fb; import numpy as np
+    >>> period=128; sig=np.sin(2*np.pi*np.arange(100*period)/period)
+    >>> sig=sig+np.random.randn(len(sig))*0.1
+    >>> acc=fb.SyncAvAccumulator(period,variance=True)
+    >>> for chunk in np.array_split(sig,37):
+    >>>     acc.update(chunk)
+    >>> sav,nbBlocs=acc.sav,acc.nbBlocs
+
+    Note
+    ----
+    * Same conventions as syncAv : 1 signal = 1 row and the first sample of
+      the first chunk is the beginning of the first bloc.
+    * Only integer bloc sizes are allowed (resample the signal before if
+      the period is not an integer).
+    """
+    # Creation      : Friday 16 October 2026
+    # Modifications : Friday 16 October 2026 (Statistics computed by PhaseStats)
+    # Version       : 1.1 i
+
+    def __init__(self,blocSize,variance=False):
+        """
+        Create an empty accumulator
+
+        Parameters
+        ----------
+        blocSize : int
+            size of a block to make the mean
+
+        variance : bool, optional
+            if True, the variance of each sample of the period is also updated
+            optional, False by default
+        """
+        if not isinstance(blocSize,(int,np.integer)):
+            raise ValueError('blocSize must be an integer (resample the signal before).')
+
+        if blocSize<=0:
+            raise ValueError('Bloc must be strictly positive.')
+
+        self.blocSize=int(blocSize)
+        self.variance=variance
+        self.reset()
+
+    def reset(self):
+        """
+        Forget all the datas given to the accumulator
+        """
+        self.stats=PhaseStats(self.blocSize,2 if self.variance else 1)
+        self.rest=None    # samples of the last incomplete bloc
+
+    def update(self,datas):
+        """
+        Add a new chunk of signal(s)
+
+        Parameters
+        ----------
+        datas : np.array vector or matrix (nb_sig x chunk_len) 1 signal=1 row
+            next samples of the signal(s), the chunk can have any length
+
+        Returns
+        -------
+        nbBlocs : int
+            Number of blocs used for the synchronous average up to now
+        """
+        datas=np.asarray(datas)
+
+        if self.rest is None:
+            self.rest=np.zeros(datas.shape[:-1]+(0,),dtype=datas.dtype)
+        elif datas.shape[:-1]!=self.rest.shape[:-1]:
+            raise ValueError('The number of signals can not change between chunks.')
+
+        col=datas.shape[-1]
+        pos=0
+
+        # Complete the bloc started with the previous chunk
+        if self.rest.shape[-1]>0:
+            need=self.blocSize-self.rest.shape[-1]
+            if col<need:
+                self.rest=np.concatenate((self.rest,datas),axis=-1)
+                return self.nbBlocs
+            bloc=np.concatenate((self.rest,datas[...,0:need]),axis=-1)
+            self.addBlocs(bloc[...,np.newaxis,:])
+            pos=need
+
+        # Complete blocs of this chunk : reshape without copy
+        nb=(col-pos)//self.blocSize
+        if nb>0:
+            end=pos+nb*self.blocSize
+            self.addBlocs(np.reshape(datas[...,pos:end],datas.shape[:-1]+(nb,self.blocSize)))
+            pos=end
+
+        # Keep the incomplete bloc for the next chunk
+        self.rest=np.array(datas[...,pos:])
+
+        return self.nbBlocs
+
+    def addBlocs(self,blocs):
+        """
+        Add complete blocs (already split)
+
+        Parameters
+        ----------
+        blocs : np.array (nb_sig x) nb x blocSize
+            blocs to add in the mean
+        """
+        self.stats.update(blocs)
+
+    @property
+    def nbBlocs(self):
+        """
+        Number of blocs used for the synchronous average
+        """
+        return self.stats.nbBlocs
+
+    @property
+    def sav(self):
+        """
+        Synchronous average of each signals (same as syncAv)
+        """
+        if self.nbBlocs==0:
+            raise ValueError('The datas must have at least 1 blocs.')
+        return self.stats.mean
+
+    @property
+    def var(self):
+        """
+        Variance of each sample of the period (np.var convention : divided by nbBlocs)
+        """
+        if not self.variance:
+            raise ValueError('Create the accumulator with variance=True.')
+        return self.stats.var
+
+# Auto-test if Python script launched from console ---------------------------
+if __name__ == '__main__':
+    print("Auto-test if Python script launched from console")
+    print("The signal is given by random length chunks.")
+    print("The differences with syncAv and np.var should be close to 0.")
+
+    import fbonnardot.cyclostationarity.syncAv as syncAv
+
+    period=128; cycles=100
+    sig=np.sin(2*np.pi*np.arange(period*cycles+50)/period)
+    sig=np.array([sig,sig+np.random.randn(np.size(sig))*0.1])
+
+    acc=SyncAvAccumulator(period,variance=True)
+    cuts=np.sort(np.random.randint(0,sig.shape[-1],20))
+    for chunk in np.split(sig,cuts,axis=-1):
+        acc.update(chunk)
+
+    sav,nbBlocs=syncAv(sig,period)
+    tens=np.reshape(sig[:,0:nbBlocs*period],(2,nbBlocs,period))
+    print("Number of blocs   :",acc.nbBlocs,nbBlocs)
+    print("Difference (mean) :",np.max(np.abs(acc.sav-sav)))
+    print("Difference (var)  :",np.max(np.abs(acc.var-np.var(tens,1))))
@@ -14,8 +14,29 @@ Details
 
 cycloTimeCorr
     Compute temporal (inter)-correlation of a cyclostationnary signal.
+cycloTimeCorrMulti
+    Temporal (inter)-correlation of all the pairs of channels of a multichannel signal
+CycloTimeCorrAccumulator
+    Incremental and mergeable temporal (inter)-correlation of signals given by chunks
+cycloSpecCorr
+    Spectral correlation / coherence S(alpha,f) by averaged cyclic periodograms
+fastSC
+    Fast spectral coherence for a wide range of cyclic frequencies (STFT based)
+PhaseStats
+    One pass and mergeable statistics (up to 4th order) of each phase of a period
 syncAv
     Computes the synchronous average
+SyncAvAccumulator
+    Incremental synchronous average of signals given by chunks
+ExpSyncAv
+    Exponentially weighted synchronous average (forgetting factor) for online monitoring
+syncAvAngular
+    Synchronous average in the angular domain (variable speed, tachometer pulses)
+syncAvMemmap
+    Synchronous average of a recording read chunk by chunk (memmap or file)
+syncAvMulti
+    Synchronous averages for several periods (shafts) in one reading
+
 Note
 ----
 Version 2019.11 09-Dec-2019
@@ -53,8 +74,28 @@ __status__ = "Prototype"
 
 __all__=[
         'cycloTimeCorr',
-        'syncAv'
+        'cycloTimeCorrMulti',
+        'CycloTimeCorrAccumulator',
+        'cycloSpecCorr',
+        'fastSC',
+        'PhaseStats',
+        'syncAv',
+        'SyncAvAccumulator',
+        'ExpSyncAv',
+        'syncAvAngular',
+        'syncAvMemmap',
+        'syncAvMulti'
 ]
 
 from .cycloTimeCorr  import cycloTimeCorr
+from .cycloTimeCorrMulti import cycloTimeCorrMulti
+from .CycloTimeCorrAccumulator import CycloTimeCorrAccumulator
+from .cycloSpecCorr  import cycloSpecCorr
+from .fastSC         import fastSC
+from .PhaseStats     import PhaseStats
 from .syncAv         import syncAv
+from .SyncAvAccumulator import SyncAvAccumulator
+from .ExpSyncAv      import ExpSyncAv
+from .syncAvAngular  import syncAvAngular
+from .syncAvMemmap   import syncAvMemmap
+from .syncAvMulti    import syncAvMulti
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 16 17:25:12 2026
+
+@author: Frédéric BONNARDOT, AGPL-3.0-or-later license
+(c) Frédéric BONNARDOT, 2001-2026
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+This code is given as is without warranty of any kind.
+In no event shall the authors or copyright holder be liable for any claim
+                                                   damages or other liability.
+
+If you change or adapt this function, change its name (for example add your
+                                                       initial after the name)
+"""
+
+import numpy as np                       # matrix management
+import scipy.signal as sigp              # signal processing (windows)
+from fbonnardot.signalproc.fftBackend import fft
+import matplotlib.pyplot as plt          # plots
+
+def cycloSpecCorr (x,alpha,nfft=256,noverlap=None,window='hann',y=None,coherence=False,maxElem=2**16,graph=0):
+    """
+    Spectral correlation (or spectral coherence) by averaged cyclic periodograms.
+
+    Parameters
+    ----------
+    x : vector
+        signal
+
+    alpha : scalar or vector
+        normalized cyclic frequencies (1 = sampling frequency)
+
+    nfft : int, optional
+        length of the segments (frequency resolution 1/nfft)
+        optional, 256 by default
+
+    noverlap : int, optional
+        number of samples shared by consecutive segments
+        optional, None by default (nfft//2)
+
+    window : str, tuple or vector, optional
+        window applied on each segment (see scipy.signal.get_window)
+        optional, 'hann' by default
+
+    y : vector, optional
+        second signal for the cross spectral correlation Sxy
+        optional, None by default (Sxx is computed)
+
+    coherence : bool, optional
+        if True, returns the spectral coherence instead of the correlation
+        optional, False by default
+
+    maxElem : int, optional
+        maximum number of elements of the temporary arrays (segments are
+        processed by groups)
+        optional, 2**16 by default (fits in the processor cache)
+
+    graph : scalar, optionnal
+        display |S(alpha,f)| if 1
+        optionnal, 0 by default
+
+    Returns
+    -------
+    S : matrix len(alpha) x nfft
+        spectral correlation S(alpha,f) or coherence
+
+    f : vector
+        normalized frequencies (-0.5 to 0.5)
+
+    Note
+    ----
+    * S(alpha,f)=E[X(f+alpha/2).conj(Y(f-alpha/2))] is estimated by
+      averaging X_k(f+alpha/2).conj(Y_k(f-alpha/2)) over the segments k
+      (Welch estimator of the cyclic periodogram).
+    * The FFT of each segment is computed once (and once more shifted by
+      half a bin if an alpha needs it). X_k(f+alpha/2) and Y_k(f-alpha/2)
+      are read by shifting the bins and the products of the cyclic
+      frequencies sharing the same shift are weighted by the phases
+      e^(-j.2.pi.alpha.k.hop) in one matrix product.
+    * The result is exact for alpha multiple of 1/nfft. For the other
+      values, the residual shift (<1/(2.nfft)) is only corrected in the
+      normalization (same as fastSC).
+    * The cost is O(len(alpha) x len(x)) : use it for selected cyclic
+      frequencies. For a full (alpha,f) map with a fine resolution in alpha,
+      use fastSC.
+    * The coherence uses the PSD estimated with alpha=0 interpolated at
+      f+alpha/2 and f-alpha/2.
+
+    Example
+    -------
+    >>> import fbonnardot as fb; import numpy as np
+    >>> N=2**18; t=np.arange(N)
+    >>> sig=(1+np.cos(2*np.pi*0.01*t))*np.random.randn(N)   # alpha=0.01
+    >>> alpha=np.linspace(0,0.03,61)
+    >>> S,f=fb.cycloSpecCorr(sig,alpha,coherence=True,graph=1)
+    """
+
+    # Creation              : Friday 16 October 2026
+    # Modifications         : Friday 16 October 2026 (FFT backend of the package)
+    #                         Friday 16 October 2026 (FFT of the segments computed once)
+    # Version               : 1.2 i
+
+    x=np.asarray(x)
+    alpha=np.atleast_1d(np.asarray(alpha,dtype=float))
+    if y is not None:
+        y=np.asarray(y)
+        if len(y)!=len(x):
+            raise ValueError ("x and y must have the same size")
+
+    if noverlap is None:
+        noverlap=nfft//2
+    hop=nfft-noverlap
+    if hop<=0:
+        raise ValueError('noverlap must be smaller than nfft.')
+
+    if len(x)<nfft:
+        raise ValueError('The signal must contain at least nfft samples.')
+
+    if isinstance(window,(str,tuple)):
+        w=sigp.get_window(window,nfft)
+    else:
+        w=np.asarray(window)
+        if len(w)!=nfft:
+            raise ValueError('The window must have nfft samples.')
+
+    # Segments (view, no copy) : segment k begins at sample k*hop
+    segx=np.lib.stride_tricks.sliding_window_view(x,nfft)[::hop]
+    if y is not None:
+        segy=np.lib.stride_tricks.sliding_window_view(y,nfft)[::hop]
+    K=segx.shape[0]
+
+    m=np.arange(nfft)
+    alphas=np.concatenate((alpha,[0])) if coherence else alpha
+
+    # alpha=p/nfft-delta : X(f+alpha/2) and Y(f-alpha/2) are read in the
+    # STFT (p even) or in the STFT shifted by half a bin (p odd)
+    p=np.round(alphas*nfft).astype(int)
+    delta=p/nfft-alphas
+    shifts=[(q,np.flatnonzero(p==q)) for q in np.unique(p)]
+    half=np.exp(-1j*np.pi*m/nfft)         # shift of 1/(2.nfft)
+    odd=np.any(p % 2==1)
+
+    S=np.zeros((len(alphas),nfft),dtype=complex)
+    kc=max(1,maxElem//nfft)
+    for first in range(0,K,kc):
+        k=np.arange(first,min(K,first+kc))
+        # STFT of the group of segments (computed once for all alpha)
+        wx=segx[k]*w
+        Zx=fft(wx,axis=-1)
+        Zxh=fft(wx*half,axis=-1) if odd else None
+        if y is None:
+            Zy,Zyh=Zx,Zxh
+        else:
+            wy=segy[k]*w
+            Zy=fft(wy,axis=-1)
+            Zyh=fft(wy*half,axis=-1) if odd else None
+        for q,index in shifts:
+            if q % 2==0:
+                prod=Zx[:,(m+q//2) % nfft]*np.conj(Zy[:,(m-q//2) % nfft])
+            else:
+                prod=Zxh[:,(m+q//2) % nfft]*np.conj(Zyh[:,(m-(q+1)//2) % nfft])
+            # Phase of the beginning of the segments (e^(-j.2.pi.alpha.k.hop))
+            phase=np.exp(-2j*np.pi*np.outer(alphas[index],k*hop))
+            S[index]+=phase@prod
+
+    # Normalization with the correction of the window (alpha is not exactly p/nfft)
+    kernel=np.exp(-2j*np.pi*np.outer(delta,m))@w**2
+    S=S/(K*kernel[:,np.newaxis])
+
+    if coherence:
+        # PSD at f+alpha/2 and f-alpha/2 (circular interpolation)
+        f=m/nfft
+        psd=np.real(S[-1])
+        if y is None:
+            psdx=psdy=psd
+        else:
+            psdx=np.real(cycloSpecCorr(x,0,nfft,noverlap,w,maxElem=maxElem)[0][0])
+            psdy=np.real(cycloSpecCorr(y,0,nfft,noverlap,w,maxElem=maxElem)[0][0])
+            psdx=np.fft.ifftshift(psdx); psdy=np.fft.ifftshift(psdy)
+        S=S[:-1]
+        for index in range(len(alpha)):
+            px=np.interp(f+alpha[index]/2,f,psdx,period=1)
+            py=np.interp(f-alpha[index]/2,f,psdy,period=1)
+            S[index]=S[index]/np.sqrt(px*py)
+
+    S=np.fft.fftshift(S,axes=-1)
+    f=np.fft.fftshift(np.fft.fftfreq(nfft))
+
+    if not np.iscomplexobj(x) and (y is None or not np.iscomplexobj(y)) and np.all(alpha==0):
+        S=np.real(S)
+
+    if graph==1:
+        plt.figure()
+        plt.pcolormesh(f,alpha,np.abs(S),shading='auto')
+        plt.xlabel('Normalized frequency f'); plt.ylabel(r'Cyclic frequency $\alpha$')
+        plt.title('Spectral coherence' if coherence else 'Spectral correlation')
+        plt.colorbar()
+        plt.show()
+
+    return S,f
+
+# Auto-test if Python script launched from console ---------------------------
+if __name__ == '__main__':
+    import time
+    print("Auto-test if Python script launched from console")
+    print("A white noise is amplitude modulated at alpha=0.01.")
+    print("The coherence map should show a line at alpha=0.01 (and 0).")
+
+    N=10**7; t=np.arange(N)
+    sig=(1+np.cos(2*np.pi*0.01*t))*np.random.randn(N)
+    alpha=np.linspace(0,0.03,31)
+    start=time.time()
+    S,f=cycloSpecCorr(sig,alpha,coherence=True,graph=1)
+    print(len(alpha),"cyclic frequencies on",N,"samples :",time.time()-start,"s")
+    print("Mean coherence at alpha=0.01 :",np.mean(np.abs(S[10])))
+    print("Mean coherence at alpha=0.015 :",np.mean(np.abs(S[15])))
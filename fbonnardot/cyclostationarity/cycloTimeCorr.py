@@ -29,9 +29,9 @@ If you change or adapt this function, change its name (for example add your
 import numpy as np                       # matrix management
 import matplotlib.pyplot as plt          # plots
 from mpl_toolkits.mplot3d import axes3d  # 3D projection
-import fbonnardot.cyclostationarity.syncAv
+from fbonnardot.various.progressHook import progressStage
 
-def cycloTimeCorr (x,y,period,vect_tau,graph=0):
+def cycloTimeCorr (x,y,period,vect_tau,graph=0,alpha=None):
     """
     Compute temporal (inter)-correlation of a cyclostationnary signal.
 
@@ -49,11 +49,23 @@ def cycloTimeCorr (x,y,period,vect_tau,graph=0):
     graph : scalar, optionnal
         display a graph if 1
         optionnal, 0 by default
-        
+
+    alpha : vector, optionnal
+        normalized cyclic frequencies (n/period for the n-th harmonic), if
+        given the cyclic correlation Rxy(alpha,tau) is returned instead of
+        Rxy(t,tau)
+        optionnal, None by default
+
     Returns
     -------
     Rxy : matrix of size period x len(vect_tau)
-        Estimated correlation Rxy(t,tau)
+        Estimated correlation Rxy(t,tau) (complex if x or y is complex)
+
+    or if alpha is given
+
+    Rxy : matrix of size len(alpha) x len(vect_tau)
+        Estimated cyclic correlation Rxy(alpha,tau)=mean_t Rxy(t,tau).exp(-2j.pi.alpha.t)
+        (equal to np.fft.fft(Rxy(t,tau),axis=0)[n]/period for alpha=n/period)
                       
     Note
     -----
@@ -63,6 +75,12 @@ def cycloTimeCorr (x,y,period,vect_tau,graph=0):
     * Since synchronous average is used, all cyclic period not multiple of period
         are destroyed or reduced
 
+    * All lags are computed together by groups (see lagBlockSums), the memory
+        used is bounded whatever the number of lags
+
+    * With alpha, each group of lags is reduced along t by a partial DFT just
+        after being computed : the period x len(vect_tau) matrix is never built
+
     Example
     -------
     >>> import fbonnardot as fb
@@ -73,13 +91,17 @@ def cycloTimeCorr (x,y,period,vect_tau,graph=0):
     >>> data=np.sin(2*np.pi/per*np.arange(N))*bruit
     >>> tau=np.arange(0,20,2)
     >>> Rxx=fb.cycloTimeCorr(data,data,per,tau,graph=1)
+    >>> Rxx_alpha=fb.cycloTimeCorr(data,data,per,tau,alpha=[0,2/per])
     """
     
     # Creation              : Tuesday 4 July 2017      (MATLAB version)
     # Modifications         : Tuesday 19 November 2019 (Translation to Python 3.7)
     #                         Thursday 2 April 2020    (Docstring anf Auto test)
     #                         Thurday 9 April 2020 (change name form cyclicTimeCorr to cycloTimeCorr)
-    # Version               : 1.1 i
+    #                         Friday 16 October 2026 (All lags computed together on period aligned blocks)
+    #                         Friday 16 October 2026 (Cyclic correlation for given cyclic frequencies)
+    #                         Friday 16 October 2026 (Progress reported to the hook of setProgressHook)
+    # Version               : 1.4 i
 
     Nx=len(x)
     Ntau=len(vect_tau)
@@ -87,22 +109,30 @@ def cycloTimeCorr (x,y,period,vect_tau,graph=0):
     if Nx!=len(y):
         raise ValueError ("x and y must have the same size")
 
-    Rxy=np.zeros((period,Ntau))
+    if alpha is None:
+        Rxy=np.zeros((period,Ntau),dtype=np.result_type(x,y,float))
+    else:
+        # Partial DFT along t (only the requested cyclic frequencies)
+        alpha=np.atleast_1d(np.asarray(alpha,dtype=float))
+        dft=np.exp(-2j*np.pi*np.outer(alpha,np.arange(period)))/period
+        Rxy=np.zeros((len(alpha),Ntau),dtype=complex)
 
+    for index,sums,nb in lagBlockSums(x,y,period,vect_tau):
+        if alpha is None:
+            Rxy[:,index]=sums/nb
+        else:
+            Rxy[:,index]=(dft@sums)/nb
 
-    for index in range(Ntau):
-        progressBar(index/Ntau)
-        tau=vect_tau[index]
-        
-        t=np.arange(tau//2+1,Nx-tau//2)
-        t=t[0:int(np.floor(len(t)/period))*period] # integer number of period
-        sAv,nb=fbonnardot.cyclostationarity.syncAv(x[t-tau//2]*np.conj(y[t+tau//2]),period)
-        Rxy[:,index]=sAv
-
-    progressBar(-1)
-    
     # Graph if graph=1
-    if graph==1:
+    if graph==1 and alpha is not None:
+        plt.figure()
+        for index in range(len(alpha)):
+            plt.plot(vect_tau,np.abs(Rxy[index]),label=r'$\alpha$=%g' % alpha[index])
+        plt.xlabel(r'$\tau$'); plt.ylabel(r'$|Rxy(\alpha,\tau)|$')
+        plt.legend()
+        plt.title('Modulus of Cyclic Correlation')
+        plt.show()
+    elif graph==1:
         fig = plt.figure()
         t=np.arange(0,period)
         ax = fig.add_subplot(111, projection='3d')
@@ -116,23 +146,88 @@ def cycloTimeCorr (x,y,period,vect_tau,graph=0):
     return Rxy
 
 
-def progressBar(position):
+def lagBlockSums(x,y,period,vect_tau,maxElem=2**22,stage='cycloTimeCorr'):
     """
-    Display a text progress bar
-    
+    Sums over the blocs of x(t-tau/2)*conj(y(t+tau/2)) for all lags.
+
+    x is reshaped once into period aligned blocks (view) and y is seen through
+    a sliding window view : y[t+d] for all lags d is a strided view so the
+    lags of a group are gathered together and reduced with one einsum.
+    When x contains several signals, the lags of y gathered once are used
+    for all the signals of x.
+
     Parameters
     ----------
-    
-    position   : between 0 and 1
-                 otherwise suppress the bar
+    x : vector or matrix (nb_sig x sig_len) 1 signal=1 row
+        signals x
+    y : vector
+        signal y (same size as the signals x)
+    period : int
+        cyclic period
+    vect_tau : vector
+        positive delays (the delay used is 2*(tau//2) like cycloTimeCorr)
+    maxElem : int, optional
+        maximum number of elements of the temporary arrays
+    stage : str, optional
+        name of the stage reported to the progress hook (None : not reported)
+
+    Returns (generator)
+    -------
+    index : vector
+        indices in vect_tau of the lags of the group
+    sums : matrix (nb_sig x) period x len(index)
+        sum over blocs for each phase and each lag
+    nb : vector
+        number of blocs used for each lag
     """
-    
-    if position>=0 and position<=1:
-        nb_done=int(np.ceil(position*50))
-        print("\rcycloTimeCorr : \u001b[44;1m"+">"*nb_done+"\u001b[0m\u001b[44m"+"-"*(50-nb_done)+"\u001b[0m",end='')
-    else:
-        print("\r"+" "*70+"\r\u001b[A")
-        
+    x=np.asarray(x); y=np.asarray(y)
+    Nx=x.shape[-1]
+    d=2*(np.asarray(vect_tau,dtype=int)//2)    # y index - x index
+
+    if np.any(d<0):
+        raise ValueError('Delays must be positive.')
+
+    # Samples 1+j+k*period of x, blocs k<nb for each lag
+    nb=(Nx-1-d)//period
+    if np.any(nb<1):
+        raise ValueError('The signals must contain at least 1 period for each lag.')
+    dmax=int(np.max(d))
+    nbmin=(Nx-1-dmax)//period
+
+    xb=np.reshape(x[...,1:1+np.max(nb)*period],x.shape[:-1]+(-1,period))
+    # win[m,l]=y[1+m+l] -> nbmin x period x (dmax+1) without copy
+    win=np.lib.stride_tricks.sliding_window_view(y[1:],dmax+1)
+    win=np.reshape(win[0:nbmin*period],(nbmin,period,dmax+1))
+    conj=np.iscomplexobj(y)
+
+    group=min(len(d),64)
+    kc=max(1,maxElem//(period*group))
+    nbIter=(-(-len(d)//group))*(-(-nbmin//kc))
+    with progressStage(stage,nbIter) as progress:
+        done=0
+        for first in range(0,len(d),group):
+            index=np.arange(first,min(len(d),first+group))
+            sums=np.zeros(x.shape[:-1]+(period,len(index)),dtype=np.result_type(x,y,float))
+            # Blocs available for all lags : gather the lags of the group
+            for k in range(0,nbmin,kc):
+                stop=min(k+kc,nbmin)
+                yc=win[k:stop][:,:,d[index]]
+                if conj:
+                    yc=np.conj(yc)
+                sums+=np.einsum('...kj,kjl->...jl',xb[...,k:stop,:],yc)
+                done+=1
+                progress.update(done)
+            # Last blocs only available for the smallest lags
+            for col in range(len(index)):
+                lag=index[col]
+                if nb[lag]>nbmin:
+                    start=1+nbmin*period+d[lag]
+                    yl=np.reshape(y[start:start+(nb[lag]-nbmin)*period],(-1,period))
+                    if conj:
+                        yl=np.conj(yl)
+                    sums[...,col]+=np.sum(xb[...,nbmin:nb[lag],:]*yl,-2)
+            yield index,sums,nb[index]
+
 # Auto-test if Python script launched from console ---------------------------
 if __name__ == '__main__':
     print("Auto-test if Python script launched from console")
@@ -147,3 +242,8 @@ if __name__ == '__main__':
     data=np.sin(2*np.pi/per*np.arange(N))*bruit
     tau=np.arange(0,20,2)
     Rxx=cycloTimeCorr(data,data,per,tau,graph=1)
+
+    print("Cyclic correlation at alpha=0 and 2/per compared to the FFT of Rxx")
+    print("(differences should be close to 0).")
+    Rxx_alpha=cycloTimeCorr(data,data,per,tau,alpha=[0,2/per])
+    print(np.max(np.abs(Rxx_alpha-np.fft.fft(Rxx,axis=0)[[0,2]]/per)))
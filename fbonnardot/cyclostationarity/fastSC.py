@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 16 18:10:37 2026
+
+@author: Frédéric BONNARDOT, AGPL-3.0-or-later license
+(c) Frédéric BONNARDOT, 2001-2026
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+This code is given as is without warranty of any kind.
+In no event shall the authors or copyright holder be liable for any claim
+                                                   damages or other liability.
+
+If you change or adapt this function, change its name (for example add your
+                                                       initial after the name)
+"""
+
+import numpy as np                       # matrix management
+import scipy.signal as sigp              # signal processing (windows)
+from fbonnardot.signalproc.fftBackend import fft,rfft
+
+def fastSC (x,alphaMax,nfft=256,hop=None,window='hann',dalpha=None,coherence=True,maxElem=2**20):
+    """
+    Fast spectral coherence (or correlation) for all the cyclic frequencies up to alphaMax.
+
+    Parameters
+    ----------
+    x : vector
+        signal
+
+    alphaMax : float
+        maximum normalized cyclic frequency (1 = sampling frequency)
+
+    nfft : int, optional
+        length of the STFT window (frequency resolution 1/nfft)
+        optional, 256 by default
+
+    hop : int, optional
+        number of samples between two STFT frames (must be lower than nfft/2
+        so that the cyclic frequencies are not aliased)
+        optional, None by default (nfft//4)
+
+    window : str, tuple or vector, optional
+        STFT window (see scipy.signal.get_window)
+        optional, 'hann' by default
+
+    dalpha : float, optional
+        cyclic frequency resolution (rounded to the grid 1/(2**n.hop))
+        optional, None by default (about 1/len(x))
+
+    coherence : bool, optional
+        if True, returns the spectral coherence else the spectral correlation
+        optional, True by default
+
+    maxElem : int, optional
+        maximum number of elements of the temporary arrays
+        optional, 2**20 by default
+
+    Returns
+    -------
+    S : matrix len(alpha) x len(f)
+        spectral coherence (or correlation), 1 line per cyclic frequency
+
+    f : vector
+        normalized frequencies (0 to 0.5 for a real signal, -0.5 to 0.5 else)
+
+    alpha : vector
+        normalized cyclic frequencies (0 to alphaMax with a step dalpha)
+
+    Note
+    ----
+    * The STFT X[k,i] of the signal is computed once. For each bin shift p,
+      the products X[k,i+p/2].conj(X[k,i-p/2]) are Fourier transformed along
+      the frames k : each FFT gives all the cyclic frequencies alpha close to
+      p/nfft (|alpha-p/nfft|<=1/(2.nfft)) at once, instead of one cyclic
+      periodogram per alpha (see cycloSpecCorr).
+    * The difference between alpha and p/nfft is corrected by the spectral
+      window of the squared STFT window.
+    * For an odd p, the frequency is known within half a bin (1/(2.nfft)).
+    * The STFT (len(x)/hop x nfft/2 complex for a real signal) is kept in
+      memory.
+    * J. Antoni, C. Xin, M. Gerard, "Fast computation of the spectral
+      correlation", Mechanical Systems and Signal Processing, vol 92, 2017.
+
+    Example
+    -------
+    >>> import fbonnardot as fb; import numpy as np
+    >>> N=2**20; t=np.arange(N)
+    >>> sig=(1+np.cos(2*np.pi*0.013*t))*np.random.randn(N)
+    >>> S,f,alpha=fb.fastSC(sig,0.05,dalpha=1e-5)
+    >>> fb.plotMatrix(np.abs(S),f[1]-f[0],alpha[1]-alpha[0],'f','alpha','SC')
+    """
+
+    # Creation              : Friday 16 October 2026
+    # Modifications         : Friday 16 October 2026 (FFT backend of the package)
+    # Version               : 1.1 i
+
+    x=np.asarray(x)
+    real=not np.iscomplexobj(x)
+    if hop is None:
+        hop=nfft//4
+    if hop<=0 or 2*hop>nfft:
+        raise ValueError('hop must be between 1 and nfft/2.')
+    if len(x)<nfft:
+        raise ValueError('The signal must contain at least nfft samples.')
+    if alphaMax<0 or alphaMax>=1:
+        raise ValueError('alphaMax must be between 0 and 1.')
+
+    if isinstance(window,(str,tuple)):
+        w=sigp.get_window(window,nfft)
+    else:
+        w=np.asarray(window)
+        if len(w)!=nfft:
+            raise ValueError('The window must have nfft samples.')
+    energy=np.sum(w**2)
+
+    # STFT (one sided for a real signal), frames are processed by groups
+    frames=np.lib.stride_tricks.sliding_window_view(x,nfft)[::hop]
+    K=frames.shape[0]
+    nbins=nfft//2+1 if real else nfft
+    X=np.empty((K,nbins),dtype=complex)
+    kc=max(1,maxElem//nfft)
+    for first in range(0,K,kc):
+        if real:
+            X[first:first+kc]=rfft(frames[first:first+kc]*w,axis=-1)
+        else:
+            X[first:first+kc]=fft(frames[first:first+kc]*w,axis=-1)
+    psd=np.mean(np.abs(X)**2,0)/energy
+
+    # Output grids
+    if real:
+        bins=np.arange(nbins)
+        f=bins/nfft
+    else:
+        bins=np.fft.fftshift(np.arange(nfft))
+        f=np.fft.fftshift(np.fft.fftfreq(nfft))
+    if dalpha is None:
+        dalpha=1/(K*hop)
+    Kfft=int(2**np.ceil(np.log2(max(1,1/(dalpha*hop)))))
+    dalpha=1/(Kfft*hop)
+    alpha=np.arange(int(np.floor(alphaMax/dalpha))+1)*dalpha
+
+    S=np.zeros((len(alpha),len(f)),dtype=complex)
+    m=np.arange(nfft)
+    kc=max(1,maxElem//len(f))
+    for p in range(int(np.round(alphaMax*nfft))+1):
+        # Cyclic frequencies associated to the shift p
+        q=np.arange(len(alpha))
+        q=q[np.round(alpha*nfft)==p]
+        if len(q)==0:
+            continue
+        up,upConj=spectrumBins(bins+(p+1)//2,nfft,real)
+        down,downConj=spectrumBins(bins-p//2,nfft,real)
+
+        # Products folded on Kfft frames (exact for the grid alpha=q/(Kfft.hop))
+        folded=np.zeros((Kfft,len(f)),dtype=complex)
+        for first in range(0,K,kc):
+            last=min(K,first+kc)
+            A=X[first:last,up]
+            A[:,upConj]=np.conj(A[:,upConj])
+            B=X[first:last,down]
+            B[:,~downConj]=np.conj(B[:,~downConj])
+            prod=A*B
+            start=first
+            while start<last:
+                stop=min(last,(start//Kfft+1)*Kfft)
+                folded[start % Kfft:start % Kfft+stop-start]+=prod[start-first:stop-first]
+                start=stop
+        spectrum=fft(folded,axis=0)[q % Kfft]
+
+        # Correction of the window (alpha is not exactly p/nfft)
+        delta=p/nfft-alpha[q]
+        kernel=np.exp(-2j*np.pi*np.outer(delta,m))@w**2
+        S[q]=spectrum/kernel[:,np.newaxis]/K
+
+        if coherence:
+            S[q]=S[q]/np.sqrt(psd[up]*psd[down])
+
+    return S,f,alpha
+
+def spectrumBins(index,nfft,real):
+    """
+    Columns of the STFT for the bins index (negative allowed).
+
+    For a real signal only the bins 0 to nfft/2 are kept : the others are the
+    conjugates of the bins nfft-index.
+
+    Returns
+    -------
+    columns : vector of int
+    conjugate : vector of bool
+        True if the column must be conjugated
+    """
+    index=np.asarray(index) % nfft
+    if not real:
+        return index,np.zeros(len(index),dtype=bool)
+    conjugate=index>nfft//2
+    return np.where(conjugate,nfft-index,index),conjugate
+
+# Auto-test if Python script launched from console ---------------------------
+if __name__ == '__main__':
+    import time
+    import matplotlib.pyplot as plt
+    from fbonnardot.cyclostationarity.cycloSpecCorr import cycloSpecCorr
+    print("Auto-test if Python script launched from console")
+    print("A white noise is amplitude modulated at alpha=0.013.")
+    print("The coherence should be close to 2/3 at alpha=0.013 and close to")
+    print("cycloSpecCorr computed for the same cyclic frequency.")
+
+    N=2**20; t=np.arange(N)
+    alpha0=1704/2**17      # 0.013 on the grid of the cyclic frequencies
+    sig=(1+np.cos(2*np.pi*alpha0*t))*np.random.randn(N)
+    start=time.time()
+    S,f,alpha=fastSC(sig,0.05,dalpha=2**-17)
+    print(len(alpha),"cyclic frequencies x",len(f),"frequencies :",time.time()-start,"s")
+    print("Mean coherence at alpha=0.013 :",np.mean(np.abs(S[1704,10:-10])))
+    Sref,fref=cycloSpecCorr(sig,alpha0,256,192,coherence=True)
+    print("cycloSpecCorr                 :",np.mean(np.abs(Sref[0,128+10:-10])))
+
+    plt.figure()
+    plt.plot(alpha,np.mean(np.abs(S),1))
+    plt.xlabel(r'Cyclic frequency $\alpha$'); plt.ylabel('Mean spectral coherence')
+    plt.show()
@@ -28,10 +28,10 @@ If you change or adapt this function, change its name (for example add your
 """
 
 import numpy as np                       # matrix management
-import scipy.interpolate as interp       # interpolation
 import warnings
+from fbonnardot.signalproc.resamplePeriod import resamplePeriod
 
-def syncAv (datas,blocSize,resid=False):
+def syncAv (datas,blocSize,resid=False,out=None,method='poly'):
     """
     Computes the synchronous average of one or more signals.
     
@@ -47,6 +47,19 @@ def syncAv (datas,blocSize,resid=False):
         returns the residual if resid is True
         optional, False by default
 
+    out : np.array, optional
+        array where the residual is written (can be datas itself to work in place)
+        it must have the shape of datas (or of the resampled datas if
+        blocSize is not an integer) and a float dtype (complex for complex
+        signals)
+        optional, None by default (a new array is created)
+
+    method : str, optional
+        resampling method if blocSize is not an integer (see resamplePeriod)
+            - 'poly'  : rational polyphase filter
+            - 'cubic' : cubic interpolation (method of versions up to 1.4)
+        optional, 'poly' by default
+
     Returns
     -------
     sav : np.array
@@ -63,6 +76,10 @@ def syncAv (datas,blocSize,resid=False):
     ----
     * A warning is made if the number of row is greater than the number of column.
     * A warning is made if there is not an integer number of cycles
+    * Since version 1.7, a non integer blocSize is resampled by a polyphase
+      filter instead of a cubic interpolation : the results change (a few
+      1e-3 on a noisy sine). Use method='cubic' to reproduce the results of
+      the previous versions.
     
     Examples
     --------
@@ -111,7 +128,13 @@ def syncAv (datas,blocSize,resid=False):
     # Modifications         : Monday 7 January 2019  (Translation to Python 3.6)
     #                         Saturday 9 March 2019   (Can return the residual)
     #                         Thursday 2 April 2020 (Auto test)
-    # Version               : 1.4 i
+    #                         Friday 16 October 2026 (Resample all signals in one call)
+    #                                                (Residual without tiling, out parameter)
+    #                                                (Polyphase resampling with resamplePeriod,
+    #                                                 results change for non integer periods)
+    #                                                (dtype of out checked)
+    #                                                (method : 'cubic' gives the results of version 1.4)
+    # Version               : 1.9 i
 
     # Original name : msynchrone.m
 
@@ -131,24 +154,17 @@ def syncAv (datas,blocSize,resid=False):
         warnings.warn('Number of row>number of column ? 1 row = 1 signal')
    
     # Manage not integer periods
-    if type(blocSize) is not int:
+    if not isinstance(blocSize,(int,np.integer)):
         warnings.warn ('Not an integer period => resampling.')
-        step=blocSize/np.ceil(blocSize)
-        if li>1:
-            donnees2=np.zeros(li,int(np.ceil((col-1)/step)))
-            for index in range(li):
-                ifunc=interp.interp1d(np.arange(1,col+1),datas[index,:],kind='cubic')
-                donnees2[index,:]=ifunc(np.arange(1,col,step))
-        else:
-            ifunc=interp.interp1d(np.arange(1,col+1),datas,kind='cubic')
-            donnees2=ifunc(np.arange(1,col,step))
+        # All signals (rows) are resampled at once (polyphase filter by chunks)
+        donnees2,newSize,step=resamplePeriod(datas,blocSize,method)
         if resid:
-            sav,nbBlocs,res=syncAv (donnees2,int(np.ceil(blocSize)),resid)
-            residu=res
+            sav,nbBlocs,residu=syncAv (donnees2,newSize,resid,out)
         else:
-            sav,nbBlocs=syncAv (donnees2,int(np.ceil(blocSize)),resid)
+            sav,nbBlocs=syncAv (donnees2,newSize,resid)
     else:
         # Compute synchronous average
+        blocSize=int(blocSize)
         nbBlocs=col//blocSize
         
         if col % blocSize!=0:
@@ -162,18 +178,64 @@ def syncAv (datas,blocSize,resid=False):
             tens=np.reshape(datas[:,0:(nbBlocs*blocSize)],[li,nbBlocs,blocSize])
             # nbr_sig x nbBlocs x blocSize -> nbr_sig x blocSize
             sav=np.mean(tens,1)
-            residu=datas-np.tile(sav,nbBlocs+1)[0:li,0:col]
         else:
             # sig_len -> nbBlocs x blocSize
             tens=np.reshape(datas[0:(nbBlocs*blocSize)],[nbBlocs,blocSize])
             sav=np.mean(tens,0)
-            residu=datas-np.tile(sav,nbBlocs+1)[0:col]
-            
+
+        if resid:
+            residu=syncResidual(datas,sav,out)
+
     if resid:
         return sav,nbBlocs,residu
     else:
         return sav,nbBlocs
 
+def syncResidual (datas,sav,out=None):
+    """
+    Remove the synchronous average sav from datas (1 signal = 1 row).
+
+    The datas are seen as a nb_sig x nbBlocs x blocSize tensor (view, no copy)
+    and sav is broadcasted on each bloc, the last incomplete bloc is
+    processed separately.
+
+    Parameters
+    ----------
+    datas : np.array vector or matrix (nb_sig x sig_len)
+        signals
+    sav : np.array vector or matrix (nb_sig x blocSize)
+        synchronous average of each signal
+    out : np.array, optional
+        array of the shape of datas where the residual is written
+        (can be datas itself), None to create a new array
+        its dtype must be float (complex for complex signals)
+
+    Returns
+    -------
+    out : np.array
+        residual
+    """
+    col=np.shape(datas)[-1]
+    blocSize=np.shape(sav)[-1]
+    nbBlocs=col//blocSize
+    end=nbBlocs*blocSize
+
+    if out is None:
+        out=np.empty(np.shape(datas),dtype=np.result_type(datas,sav))
+    elif np.shape(out)!=np.shape(datas):
+        raise ValueError('out must have the same shape as datas.')
+    elif not np.can_cast(np.result_type(datas,sav),out.dtype,'same_kind'):
+        raise ValueError('out must have a float dtype (complex for complex signals).')
+
+    # Complete blocs : splitting the last axis always gives a view
+    shape=np.shape(datas)[:-1]+(nbBlocs,blocSize)
+    np.subtract(np.reshape(datas[...,0:end],shape),sav[...,np.newaxis,:],
+                out=np.reshape(out[...,0:end],shape))
+    # Last incomplete bloc
+    np.subtract(datas[...,end:],sav[...,0:col-end],out=out[...,end:])
+
+    return out
+
 # Auto-test if Python script launched from console ---------------------------
 if __name__ == '__main__':
     print("Auto-test if Python script launched from console")
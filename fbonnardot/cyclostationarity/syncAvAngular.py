@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 16 11:02:36 2026
+
+@author: Frédéric BONNARDOT, AGPL-3.0-or-later license
+(c) Frédéric BONNARDOT, 2001-2026
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+This code is given as is without warranty of any kind.
+In no event shall the authors or copyright holder be liable for any claim
+                                                   damages or other liability.
+
+If you change or adapt this function, change its name (for example add your
+                                                       initial after the name)
+"""
+
+import numpy as np                       # matrix management
+import scipy.interpolate as interp       # interpolation
+from fbonnardot.cyclostationarity.syncAv import syncAv
+
+def syncAvAngular (datas,pulses,nbPoints,resid=False,kind='linear'):
+    """
+    Computes the synchronous average in the angular domain (variable speed).
+
+    Each revolution, delimited by two consecutive tachometer pulses, is
+    resampled to nbPoints angular samples. All the revolutions are resampled
+    in one batched interpolation before computing the synchronous average.
+
+    Parameters
+    ----------
+    datas : np.array vector or matrix (nb_sig x sig_len) 1 signal=1 row
+        signals used for compute synchronous average
+
+    pulses : vector
+        position (in samples, can be non integer) of the beginning of each
+        revolution, for example the minimums given by globalMinMax
+        the last pulse ends the last revolution
+
+    nbPoints : int
+        number of angular samples per revolution
+
+    resid : boolean, optional
+        returns the residual (in the angular domain) if resid is True
+        optional, False by default
+
+    kind : str, optional
+        interpolation used for resampling
+            - 'linear' : linear interpolation
+            - 'cubic'  : cubic spline interpolation
+        optional, 'linear' by default
+
+    Returns
+    -------
+    sav : np.array
+        Synchronous average of each signals (nbPoints samples per signal)
+
+    nbBlocs : int
+        Number of revolutions used for estimating the synchronous average
+
+    residual : np.array, optional
+        residual in the angular domain (nbBlocs*nbPoints samples per signal),
+        returned only if resid is True
+
+    Example
+    -------
+    >>> import fbonnardot as fb; import numpy as np
+    >>> N=200000; t=np.arange(N)
+    >>> angle=2*np.pi*(t/500+(t/N)**2*100)    # run-up
+    >>> sig=np.sin(angle)+0.5*np.sin(3*angle)+np.random.randn(N)*0.2
+    >>> pulses=np.flatnonzero(np.diff(np.floor(angle/(2*np.pi))))+1
+    >>> sav,nbBlocs=fb.syncAvAngular(sig,pulses,256)
+    """
+
+    # Creation              : Friday 16 October 2026
+    # Version               : 1.0 i
+
+    datas=np.asarray(datas)
+    pulses=np.asarray(pulses,dtype=float)
+    col=datas.shape[-1]
+
+    if len(pulses)<2:
+        raise ValueError('At least 2 pulses are needed (1 revolution).')
+
+    if np.any(np.diff(pulses)<=0):
+        raise ValueError('pulses must be strictly increasing.')
+
+    if pulses[0]<0 or pulses[-1]>col-1:
+        raise ValueError('pulses must be inside the signal.')
+
+    if kind not in ('linear','cubic'):
+        raise ValueError('Illegal value for kind.')
+
+    # Angular sampling positions : 1 row per revolution
+    # nbRev x 1 + nbRev x 1 * 1 x nbPoints -> nbRev x nbPoints
+    nbRev=len(pulses)-1
+    frac=np.arange(nbPoints)/nbPoints
+    positions=pulses[:-1,np.newaxis]+np.diff(pulses)[:,np.newaxis]*frac
+    positions=np.reshape(positions,nbRev*nbPoints)
+
+    # Resample all revolutions (and all signals) at once
+    if kind=='linear':
+        index=np.minimum(np.floor(positions).astype(int),col-2)
+        weight=positions-index
+        angular=datas[...,index]*(1-weight)+datas[...,index+1]*weight
+    else:
+        ifunc=interp.interp1d(np.arange(col),datas,kind='cubic',axis=-1)
+        angular=ifunc(positions)
+
+    return syncAv(angular,nbPoints,resid)
+
+# Auto-test if Python script launched from console ---------------------------
+if __name__ == '__main__':
+    import matplotlib.pyplot as plt
+    import time
+    print("Auto-test if Python script launched from console")
+    print("A run-up signal with about 20000 revolutions is averaged in the angular domain.")
+    print("The figure shows the synchronous average (red) over the expected waveform (blue).")
+
+    N=10000000; t=np.arange(N)
+    angle=2*np.pi*(t/800+(t/N)**2*8000)
+    sig=np.sin(angle)+0.5*np.sin(3*angle)+np.random.randn(N)*0.5
+    pulses=np.flatnonzero(np.diff(np.floor(angle/(2*np.pi))))+1
+
+    start=time.time()
+    sav,nbBlocs=syncAvAngular(sig,pulses,256)
+    print(nbBlocs,"revolutions in",time.time()-start,"s")
+
+    theta=2*np.pi*np.arange(256)/256
+    plt.figure()
+    plt.plot(theta,np.sin(theta)+0.5*np.sin(3*theta),'b')
+    plt.plot(theta,sav,'r')
+    plt.xlabel('Angle (rad)')
+    plt.legend(['expected','synchronous average'])
+    plt.show()
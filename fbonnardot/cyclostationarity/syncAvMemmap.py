@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 16 10:05:17 2026
+
+@author: Frédéric BONNARDOT, AGPL-3.0-or-later license
+(c) Frédéric BONNARDOT, 2001-2026
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+This code is given as is without warranty of any kind.
+In no event shall the authors or copyright holder be liable for any claim
+                                                   damages or other liability.
+
+If you change or adapt this function, change its name (for example add your
+                                                       initial after the name)
+"""
+
+import numpy as np                       # matrix management
+import warnings
+from fbonnardot.cyclostationarity.SyncAvAccumulator import SyncAvAccumulator
+from fbonnardot.cyclostationarity.syncAv import syncResidual
+
+def syncAvMemmap (datas,blocSize,resid=False,out=None,dtype=None,nbSig=1,chunkSize=2**20):
+    """
+    Computes the synchronous average of signals stored in a file (out-of-core).
+
+    The datas are read chunk by chunk so the memory used is bounded by the
+    chunk size whatever the size of the recording.
+
+    Parameters
+    ----------
+    datas : np.memmap, np.array or str
+        signals used for compute synchronous average (1 signal=1 row)
+            - np.memmap or np.array : vector or matrix (nb_sig x sig_len)
+            - str : name of a .npy file (opened with mmap_mode='r')
+                    or of a raw binary file (dtype must be given)
+
+    blocSize : int
+        size of a block to make the mean (must be an integer)
+
+    resid : boolean, optional
+        computes the residual if resid is True
+        optional, False by default
+
+    out : np.memmap, np.array or str, optional
+        where to write the residual (same shape as datas) :
+            - np.memmap or np.array : written in place
+            - str : name of a raw float64 file created for the residual
+        required if resid is True
+        optional, None by default
+
+    dtype : np.dtype, optional
+        type of the samples for a raw binary file (np.int16, ...)
+        optional, None by default
+
+    nbSig : int, optional
+        number of interleaved signals in a raw binary file
+        (file organized as sample 1 of each signal, sample 2 of each signal, ...)
+        optional, 1 by default
+
+    chunkSize : int, optional
+        approximative number of samples per signal read at once
+        (rounded to a multiple of blocSize)
+        optional, 2**20 by default
+
+    Returns
+    -------
+    sav : np.array
+        Synchronous average of each signals
+
+    nbBlocs : int
+        Number of blocs used for estimating the synchronous average
+
+    residual : np.memmap or np.array, optional
+        out filled with the residual, returned only if resid is True
+
+    Note
+    ----
+    * Same results as syncAv for integer bloc sizes.
+    * The residual needs a second reading of the datas.
+
+    Example
+    -------
+    >>> import fbonnardot as fb; import numpy as np
+    >>> period=128; cycles=1000
+    >>> sig=np.sin(2*np.pi*np.arange(period*cycles)/period)
+    >>> sig=sig+np.random.randn(np.size(sig))*0.1
+    >>> np.save('record.npy',sig)
+    >>> sav,nbBlocs,res=fb.syncAvMemmap('record.npy',period,resid=True,out='resid.raw')
+    """
+
+    # Creation              : Friday 16 October 2026
+    # Modifications         : Friday 16 October 2026 (Residual written without tiling)
+    # Version               : 1.1 i
+
+    # Open the datas
+    if isinstance(datas,str):
+        if datas.endswith('.npy'):
+            datas=np.load(datas,mmap_mode='r')
+        else:
+            if dtype is None:
+                raise ValueError('dtype must be given for a raw binary file.')
+            datas=np.memmap(datas,dtype=dtype,mode='r')
+            if nbSig>1:
+                datas=np.reshape(datas,(-1,nbSig)).T
+
+    if datas.ndim>2:
+        raise ValueError('datas must be a vector or a matrix.')
+
+    col=datas.shape[-1]
+
+    if blocSize>col:
+        raise ValueError ('The datas must have at least 1 blocs.')
+
+    if col % blocSize!=0:
+        warnings.warn ('The signal don\'t contain an integer number of intergers, it will be truncated.')
+
+    step=max(1,chunkSize//blocSize)*blocSize
+
+    # First reading : synchronous average
+    acc=SyncAvAccumulator(blocSize)
+    for start in range(0,col,step):
+        acc.update(np.asarray(datas[...,start:start+step],dtype=float))
+    sav,nbBlocs=acc.sav,acc.nbBlocs
+
+    if nbBlocs==1:
+        warnings.warn ('With only 1 bloc it is not synchronous average !!!')
+
+    if not resid:
+        return sav,nbBlocs
+
+    # Second reading : residual written in out
+    if out is None:
+        raise ValueError('Give an output file or memmap in out to store the residual.')
+
+    if isinstance(out,str):
+        out=np.memmap(out,dtype=np.float64,mode='w+',shape=datas.shape)
+    elif out.shape!=datas.shape:
+        raise ValueError('out must have the same shape as datas.')
+
+    for start in range(0,col,step):
+        # start is a multiple of blocSize => the chunk begins at phase 0
+        syncResidual(datas[...,start:start+step],sav,out[...,start:start+step])
+
+    if isinstance(out,np.memmap):
+        out.flush()
+
+    return sav,nbBlocs,out
+
+# Auto-test if Python script launched from console ---------------------------
+if __name__ == '__main__':
+    print("Auto-test if Python script launched from console")
+    print("A signal is written in a temporary raw int16 file.")
+    print("The differences with syncAv should be close to 0.")
+
+    import os, tempfile
+    from fbonnardot.cyclostationarity.syncAv import syncAv
+
+    period=128; cycles=1000
+    sig=np.sin(2*np.pi*np.arange(period*cycles+17)/period)
+    sig=np.array((sig+np.random.randn(np.size(sig))*0.1)*1000,dtype=np.int16)
+
+    folder=tempfile.mkdtemp()
+    name=os.path.join(folder,'record.raw')
+    sig.tofile(name)
+
+    sav,nbBlocs,res=syncAvMemmap(name,period,True,os.path.join(folder,'resid.raw'),
+                                 dtype=np.int16,chunkSize=10000)
+    sav2,nbBlocs2,res2=syncAv(np.array(sig,dtype=float),period,True)
+    print("Number of blocs       :",nbBlocs,nbBlocs2)
+    print("Difference (average)  :",np.max(np.abs(sav-sav2)))
+    print("Difference (residual) :",np.max(np.abs(res-res2)))
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 16 16:20:44 2026
+
+@author: Frédéric BONNARDOT, AGPL-3.0-or-later license
+(c) Frédéric BONNARDOT, 2001-2026
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+This code is given as is without warranty of any kind.
+In no event shall the authors or copyright holder be liable for any claim
+                                                   damages or other liability.
+
+If you change or adapt this function, change its name (for example add your
+                                                       initial after the name)
+"""
+
+import numpy as np                       # matrix management
+import warnings
+from math import gcd
+from fbonnardot.cyclostationarity.SyncAvAccumulator import SyncAvAccumulator
+from fbonnardot.cyclostationarity.syncAv import syncAv, syncResidual
+from fbonnardot.signalproc.resamplePeriod import resamplePeriod
+
+def syncAvMulti (datas,periods,resid=False,out=None,chunkSize=2**20):
+    """
+    Computes the synchronous averages of signals for several periods at once.
+
+    Parameters
+    ----------
+    datas : np.array vector or matrix (nb_sig x sig_len) 1 signal=1 row
+        signals used for compute synchronous averages (np.memmap allowed)
+
+    periods : list of int or float
+        periods (in samples) of each shaft
+
+    resid : boolean, optional
+        if True, the averages are sequentially removed : the average of
+        periods[i] is computed on the residual of periods[0..i-1] (same as
+        calling syncAv with resid=True on the residual of the previous call)
+        and the final residual is returned
+        optional, False by default
+
+    out : np.array, optional
+        array of the shape of datas where the residual is written
+        (can be datas itself to work in place)
+        optional, None by default (a new array is created)
+
+    chunkSize : int, optional
+        number of samples per signal processed at once
+        optional, 2**20 by default
+
+    Returns
+    -------
+    savs : list of np.array
+        Synchronous average of each signals for each period
+
+    nbBlocs : list of int
+        Number of blocs used for each period
+
+    residual : np.array, optional
+        residual returned only if resid is True
+
+    Note
+    ----
+    * Integer periods are computed while reading the datas once (by chunks).
+    * Non integer periods are computed on the resampled signal like syncAv,
+      periods with the same resampling step share the same resampled signal.
+    * With resid=True all periods must be integers : the contribution of the
+      previous averages on the next ones is computed from the averages only
+      (arithmetic on the periods), the datas are read once more to write the
+      residual.
+
+    Example
+    -------
+    >>> import fbonnardot as fb; import numpy as np
+    >>> N=100000; t=np.arange(N)
+    >>> sig=np.sin(2*np.pi*t/100)+np.sin(2*np.pi*t/37)+np.random.randn(N)*0.1
+    >>> savs,nbBlocs,res=fb.syncAvMulti(sig,[100,37],resid=True)
+    """
+
+    # Creation              : Friday 16 October 2026
+    # Version               : 1.0 i
+
+    col=np.shape(datas)[-1]
+    integer=[isinstance(period,(int,np.integer)) for period in periods]
+
+    for period in periods:
+        if period>col:
+            raise ValueError ('The datas must have at least 1 blocs.')
+        if period<=0:
+            raise ValueError ('Bloc must be strictly positive.')
+
+    if resid and not all(integer):
+        raise ValueError('All periods must be integers to compute the residual.')
+
+    savs=[None]*len(periods)
+    nbBlocs=[0]*len(periods)
+
+    # Integer periods : one reading of the datas for all the periods
+    accs={index:SyncAvAccumulator(int(periods[index])) for index in range(len(periods)) if integer[index]}
+    if len(accs)>0:
+        for start in range(0,col,chunkSize):
+            chunk=np.asarray(datas[...,start:start+chunkSize],dtype=float)
+            for acc in accs.values():
+                acc.update(chunk)
+        for index,acc in accs.items():
+            savs[index]=acc.sav
+            nbBlocs[index]=acc.nbBlocs
+            if col % acc.blocSize!=0:
+                warnings.warn ('The signal don\'t contain an integer number of intergers, it will be truncated.')
+
+    # Non integer periods : one resampling per resampling step
+    resampled={}
+    for index in range(len(periods)):
+        if not integer[index]:
+            blocSize=int(np.ceil(periods[index]))
+            step=periods[index]/blocSize
+            if step not in resampled:
+                warnings.warn ('Not an integer period => resampling.')
+                resampled[step]=resamplePeriod(datas,periods[index])[0]
+            savs[index],nbBlocs[index]=syncAv(resampled[step],blocSize)
+
+    if not resid:
+        return savs,nbBlocs
+
+    # Sequential removal : sav_i=A_i(x)-sum_j<i A_i(T_j(sav_j))
+    # where T_j(s) repeats s with period P_j and A_i is the average with period P_i
+    for index in range(1,len(periods)):
+        for prev in range(index):
+            savs[index]=savs[index]-periodicAverage(savs[prev],periods[index],nbBlocs[index])
+
+    # Residual : x-sum_j T_j(sav_j)
+    if out is None:
+        out=np.empty(np.shape(datas),dtype=float)
+    elif np.shape(out)!=np.shape(datas):
+        raise ValueError('out must have the same shape as datas.')
+
+    for start in range(0,col,chunkSize):
+        chunk=datas[...,start:start+chunkSize]
+        for index in range(len(periods)):
+            # Average shifted to begin at the phase of the first sample of the chunk
+            sav=np.roll(savs[index],-(start % periods[index]),axis=-1)
+            syncResidual(chunk,sav,out[...,start:start+chunkSize])
+            chunk=out[...,start:start+chunkSize]
+
+    return savs,nbBlocs,out
+
+def periodicAverage (sav,blocSize,nbBlocs):
+    """
+    Synchronous average with period blocSize of sav repeated periodically.
+
+    Computes mean over k<nbBlocs of sav[(k*blocSize+n) % len(sav)] without
+    building the repeated signal : as k increases, k*blocSize % len(sav)
+    goes through all the multiples of g=gcd(blocSize,len(sav)) every
+    L=len(sav)/g blocs, so each complete cycle adds the sum of sav over the
+    samples congruent to n modulo g.
+
+    Parameters
+    ----------
+    sav : np.array vector or matrix (nb_sig x period)
+        periodic part
+    blocSize : int
+        period used for the average
+    nbBlocs : int
+        number of blocs of the average
+
+    Returns
+    -------
+    average : np.array vector or matrix (nb_sig x blocSize)
+    """
+    period=np.shape(sav)[-1]
+    g=gcd(int(blocSize),int(period))
+    L=period//g
+    n=np.arange(blocSize)
+
+    # Complete cycles of L blocs
+    classSum=np.sum(np.reshape(sav,np.shape(sav)[:-1]+(L,g)),-2)
+    average=(nbBlocs//L)*classSum[...,n % g]
+
+    # Remaining blocs (less than L), by groups to limit the memory
+    rem=nbBlocs % L
+    group=max(1,2**20//blocSize)
+    for first in range(0,rem,group):
+        k=np.arange(first,min(rem,first+group))
+        average=average+np.sum(sav[...,(k[:,np.newaxis]*blocSize+n) % period],-2)
+
+    return average/nbBlocs
+
+# Auto-test if Python script launched from console ---------------------------
+if __name__ == '__main__':
+    import time
+    print("Auto-test if Python script launched from console")
+    print("A signal with 3 shafts is averaged at once and compared to 3 calls")
+    print("of syncAv on the successive residuals (differences should be close to 0).")
+
+    N=2000000; t=np.arange(N)
+    periods=[1000,370,256]
+    sig=np.sin(2*np.pi*t/1000)+np.sin(2*np.pi*t/37)+np.sign(np.sin(2*np.pi*t/256))
+    sig=np.array([sig,sig+np.random.randn(N)])
+
+    start=time.time()
+    savs,nbBlocs,res=syncAvMulti(sig,periods,resid=True)
+    print("syncAvMulti :",time.time()-start,"s")
+
+    start=time.time()
+    res2=sig
+    for index in range(len(periods)):
+        sav,nb,res2=syncAv(res2,periods[index],True)
+        print("Period",periods[index],": difference",np.max(np.abs(sav-savs[index])))
+    print("syncAv      :",time.time()-start,"s")
+    print("Residual difference :",np.max(np.abs(res-res2)))
@@ -29,6 +29,7 @@ If you change or adapt this function, change its name (for example add your
 
 import numpy             as np                 # matrix management
 import scipy.interpolate as interp             # interpolation
+from fbonnardot.various.progressHook import progressStage
 
 def peakDetection (signal,method='kStdThreshold',k=3,Nmax=np.Inf,k2=None):
     """
@@ -117,7 +118,8 @@ def peakDetection (signal,method='kStdThreshold',k=3,Nmax=np.Inf,k2=None):
     #                         Tuesday 17 December 2019 (Change algorithm for peakSelection)
     #                                                  (Add progress bar)
     #                         Wednesday 1st April 2020 (Auto-test, example and Numpy Docstrings)
-    # Version               : 1.2 i
+    #                         Friday 16 October 2026 (Progress reported to the hook of setProgressHook)
+    # Version               : 1.3 i
 
     # Check arguments
     if method not in ('kStdThreshold','diff','diffInterp'):
@@ -235,38 +237,19 @@ def peakSelection (pos,amp,Nmax,mindist):
     pos=pos[asrt]
     # Go from highest to lowest amplitude to remove close peaks
     n=0
-    while n<Nmax and len(pos)>n:
-        NN=np.min((Nmax,len(pos)))
-        progressBar(n/NN)
-        # Remove close peaks
-        dist=np.abs(pos-(pos[n]))
-        dist[n]=mindist+1 # To keep current at a dist=0
-        farp=np.nonzero(dist>=mindist)[0] # remove when dist<mindist
-        pos=pos[farp]
-        # Go to next value
-        n=n+1
-
-    progressBar(-1)
+    with progressStage('peakSelection',int(np.min((Nmax,len(pos))))) as stage:
+        while n<Nmax and len(pos)>n:
+            # Remove close peaks
+            dist=np.abs(pos-(pos[n]))
+            dist[n]=mindist+1 # To keep current at a dist=0
+            farp=np.nonzero(dist>=mindist)[0] # remove when dist<mindist
+            pos=pos[farp]
+            # Go to next value
+            n=n+1
+            stage.update(n)
     
     return np.sort(np.array(pos[0:n]))
 
-def progressBar(position):
-    """
-    Display a text progress bar
-    
-    Parameters
-    ----------
-    
-    position   : between 0 and 1
-                 otherwise suppress the bar
-    """
-    
-    if position>=0 and position<=1:
-        nb_done=int(np.ceil(position*50))
-        print("\rpeakDetection : \u001b[44;1m"+">"*nb_done+"\u001b[0m\u001b[44m"+"-"*(50-nb_done)+"\u001b[0m",end='')
-    else:
-        print("\r"+" "*70+"\r\u001b[A")
-        
 # Auto-test if Python script launched from console ---------------------------
 if __name__ == '__main__':
     import scipy.signal as sigp; import matplotlib.pyplot as plt
@@ -28,11 +28,12 @@ If you change or adapt this function, change its name (for example add your
 """
 
 import numpy as np                       # matrix management
-import scipy.interpolate as interp       # interpolation
 import warnings
 import matplotlib.pyplot as plt          # Plot
 #from .supPlot import supPlot
 import fbonnardot.display.supPlot
+from fbonnardot.signalproc.resamplePeriod import resamplePeriod
+from fbonnardot.cyclostationarity.PhaseStats import PhaseStats
 
 plt.rcParams['toolbar'] = 'toolmanager'  # Pour ajouter une toolbar
 
@@ -129,7 +130,10 @@ def periodPlot(data,period,selection=0,moments=0,orient='vert',overlap=0,Ts=1,sc
     #                         Monday 30 December 2019 (Add line_opts parameter) 
     #                         Thursday 6 February 2020 (orient='no' option)
     #                         Tuesday 31 March 2020 (NumPy docstring - autotest)
-    # Version               : 1.82 i
+    #                         Friday 16 October 2026 (Polyphase resampling with resamplePeriod)
+    #                                                (Moments and cumulants computed by PhaseStats)
+    #                                                (NumPy integer periods are not resampled)
+    # Version               : 1.85 i
 
     # Check parameters
     if np.isscalar(selection):
@@ -153,13 +157,10 @@ def periodPlot(data,period,selection=0,moments=0,orient='vert',overlap=0,Ts=1,sc
     puiss=None
 
     # Case of non integer periods
-    if type(period) is not int:
+    if not isinstance(period,(int,np.integer)):
         warnings.warn('Not an integer period => resampling.')
-        N=len(data)
-        step=period/np.ceil(period)
-        int_func=interp.interp1d(np.arange(1,N+1,1),data,'cubic')
-        data_int=int_func(np.arange(1,N,step))
-        return periodPlot (data_int,int(np.ceil(period)),selection,moments,orient,overlap,Ts/step,scale,axes,line_opts)
+        data_int,newPeriod,step=resamplePeriod(data,period)
+        return periodPlot (data_int,newPeriod,selection,moments,orient,overlap,Ts*step,scale,axes,line_opts)
     else:
         # Split datas
         occurences=int(np.floor (len (data) / period))
@@ -273,19 +274,14 @@ def periodPlot(data,period,selection=0,moments=0,orient='vert',overlap=0,Ts=1,sc
 
     # Statistics (mean, cumulants, ...)
     if moments!=0:
-        # Computes moments
+        # Computes moments or cumulants in one pass on the blocks
+        stats=PhaseStats(period,abs(moments)).update(blocks)
         m=np.zeros((abs(moments),period))
         for mom in range(abs(moments)):
-            m[mom,:]=np.mean(blocks**(mom+1),0)
-
-        if moments<-1:
-            # Computes cumulants
-            if moments==-4:
-                m[3,:]=cumulant4 (m [0,:],m [1,:],m [2,:],m [3,:])
-            if moments<=-3:
-                m[2,:]=cumulant3 (m [0,:],m [1,:],m [2,:])
-            if moments<=-2:
-                m[1,:]=cumulant2 (m [0,:],m [1,:])
+            if moments>0:
+                m[mom,:]=stats.moment(mom+1)
+            else:
+                m[mom,:]=stats.cumulant(mom+1)
 
         # legende
         if abs(moments)>0:
@@ -322,18 +318,6 @@ def periodPlot(data,period,selection=0,moments=0,orient='vert',overlap=0,Ts=1,sc
 
     return puiss,m
 
-# Compute cumulants
-# See the book  "Le signal aléatoire" p.52 of D. Declercq, A. Quinquis - Hermes
-
-def cumulant4 (m1,m2,m3,m4):
-    return m4-4*m1*m3-3*m2*m2+12*m1*m1*m2-6*m1*m1*m1*m1
-
-def cumulant3 (m1,m2,m3):
-    return m3-3*m1*m2+2*m1*m1
-
-def cumulant2 (m1,m2):
-    return m2-m1*m1
-
 # Auto-test if Python script launched from console ---------------------------
 if __name__ == '__main__':
     print("Auto-test if Python script launched from console")
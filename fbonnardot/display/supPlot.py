@@ -33,6 +33,7 @@ import numpy as np                       # matrix management
 import warnings
 import matplotlib.pyplot as plt          # Plot
 import matplotlib.backend_tools as tools # To create custom toolbar
+from fbonnardot.signalproc.fftBackend import fft,ifft
 
 plt.rcParams['toolbar'] = 'toolmanager'  # Pour ajouter une toolbar
 
@@ -146,7 +147,9 @@ def supPlot(datas,N=math.inf,offset=0,Ts=1,names=None,orient='vert',overlap=0,sc
     #                         Thurday 26 December 2019 (Can use 3D Matrixes)
     #                         Thursday 6 February 2020 (orient='no' option)
     #                         Tuesday 31 March 2020 (NumPy docstring - autotest)
-    # Version               : 1.92 i
+    #                         Friday 16 October 2026 (FFT and Cepstrum tools : all signals at once
+    #                                                 with the FFT backend of the package)
+    # Version               : 1.93 i
 
 
     # Find position of samples and signal axis in matrix datas
@@ -384,13 +387,11 @@ def supPlot(datas,N=math.inf,offset=0,Ts=1,names=None,orient='vert',overlap=0,sc
             # Compute Fourier Transform of each data
             datas=spparams['datas']            
             [nb_sig,t_sig]=datas.shape[-2:]
-            datasft=np.zeros([nb_sig,t_sig])
             window=np.hamming(t_sig)
-            for index in range(nb_sig):
-                if datas.ndim==2:
-                    datasft[index,:]=np.abs(np.fft.fft(datas[index,:]*window))
-                else:
-                    datasft[index,:]=np.mean(np.abs(np.fft.fft(datas[:,index,:]*window,axis=1)),axis=0)
+            # All the signals at once (mean of the modulus for 3D matrixes)
+            datasft=np.abs(fft(datas*window,axis=-1))
+            if datas.ndim==3:
+                datasft=np.mean(datasft,axis=0)
             if self.unit=='dB':
                 datasft=20*np.log10(datasft)
             plt.figure()
@@ -409,12 +410,10 @@ def supPlot(datas,N=math.inf,offset=0,Ts=1,names=None,orient='vert',overlap=0,sc
             # Compute Fourier Transform of each data
             datas=spparams['datas']            
             [nb_sig,t_sig]=datas.shape[-2:]
-            datasrceps=np.zeros([nb_sig,t_sig])
-            for index in range(nb_sig):
-                if datas.ndim==2:
-                    datasrceps[index,:]=np.real(np.fft.ifft(np.log(np.abs(np.fft.fft(datas[index,:])))))
-                else:
-                    datasrceps[index,:]=np.real(np.fft.ifft(np.log(np.mean(np.abs(np.fft.fft(datas[:,index,:],axis=1)),axis=0))))
+            datasft=np.abs(fft(datas,axis=-1))
+            if datas.ndim==3:
+                datasft=np.mean(datasft,axis=0)
+            datasrceps=np.real(ifft(np.log(datasft),axis=-1))
             plt.figure()
             supPlot(datasrceps,math.inf,0,spparams['Ts'],spparams['names'],spparams['orient'],spparams['overlap'],spparams['scale'])
 
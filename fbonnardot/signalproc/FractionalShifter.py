@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 16 21:05:43 2026
+
+@author: Frédéric BONNARDOT, AGPL-3.0-or-later license
+(c) Frédéric BONNARDOT, 2001-2026
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+This code is given as is without warranty of any kind.
+In no event shall the authors or copyright holder be liable for any claim
+                                                   damages or other liability.
+
+If you change or adapt this function, change its name (for example add your
+                                                       initial after the name)
+"""
+
+import numpy as np                       # matrix management
+from fbonnardot.signalproc.fftBackend import fft,ifft,rfft,irfft
+
+class FractionalShifter:
+    """
+    Circular fractional shifts of signals of a given length, repeated many times.
+
+    The frequency grid is computed once and the phase ramps are written in
+    buffers reused between the calls (same result as circShift with forceft).
+
+    Example
+    -------
+    >>> import fbonnardot as fb; import numpy as np
+    >>> import matplotlib.pyplot as plt
+    >>> a=np.concatenate((np.arange(65),np.arange(63,0,-1)))
+    >>> shifter=fb.FractionalShifter(len(a))
+    >>> frames=shifter.shift(a,np.arange(129)/10-6)   # 129 shifted signals
+    >>> line,=plt.plot(frames[0])
+    >>> for frame in frames:
+    >>>     line.set_ydata(frame)
+    >>>     plt.pause(0.01)
+
+    Note
+    ----
+    * The signals are not padded : the shift is circular on length samples.
+    * The FFT of a signal is computed once when it is shifted by several
+      values (shift vector broadcast against the signals).
+    """
+    # Creation      : Friday 16 October 2026
+    # Modifications : Friday 16 October 2026 (FFT backend of the package)
+    # Version       : 1.1 i
+
+    def __init__(self,length,dtype=float):
+        """
+        Create a shifter
+
+        Parameters
+        ----------
+        length : int
+            number of samples of the signals
+
+        dtype : numpy dtype, optional
+            type of the signals (real or complex)
+            optional, float by default
+        """
+        if length<=0:
+            raise ValueError('length must be strictly positive.')
+
+        self.length=int(length)
+        self.complex=np.issubdtype(np.dtype(dtype),np.complexfloating)
+        if self.complex:
+            # ex. 10 => f=[0 1 2 3 4 5 -4 -3 -2 -1]/10
+            f=np.arange(self.length)
+            f=np.where(f>self.length//2,f-self.length,f)/self.length
+        else:
+            # Positive frequencies only (real FFT)
+            f=np.arange(self.length//2+1)/self.length
+        self.omega=-2*np.pi*f
+        self.angle=None       # buffers for the phase ramps
+        self.phase=None
+
+    def shift(self,datas,shift,out=None):
+        """
+        Shift signals : decal=datas[t-shift]
+
+        Parameters
+        ----------
+        datas : np.array vector or matrix (nb_sig x length) 1 signal=1 row
+            signals to shift
+
+        shift : float or vector
+            shift of each signal (broadcast against datas.shape[:-1])
+
+        out : np.array, optional
+            array where the shifted signals are written
+            optional, None by default (a new array is created)
+
+        Returns
+        -------
+        decal : np.array (broadcast shape x length)
+            shifted signals
+        """
+        datas=np.asarray(datas)
+        if datas.shape[-1]!=self.length:
+            raise ValueError('The signals must have length samples.')
+        if np.iscomplexobj(datas) and not self.complex:
+            raise ValueError('Create the shifter with a complex dtype for complex signals.')
+
+        shift=np.asarray(shift,dtype=float)
+        shape=np.broadcast_shapes(datas.shape[:-1],shift.shape)
+
+        # Phase ramps e^(-2.i.pi.f.shift) in the reused buffers
+        size=(int(np.prod(shape)),len(self.omega))
+        if self.phase is None or self.phase.shape!=size:
+            self.angle=np.empty(size)
+            self.phase=np.empty(size,dtype=complex)
+        angle=np.reshape(self.angle,shape+(len(self.omega),))
+        phase=np.reshape(self.phase,shape+(len(self.omega),))
+        np.multiply(shift[...,np.newaxis],self.omega,out=angle)
+        np.cos(angle,out=phase.real)
+        np.sin(angle,out=phase.imag)
+
+        if self.complex:
+            tf=fft(datas,axis=-1)
+            phase*=tf
+            decal=ifft(phase,axis=-1)
+        else:
+            tf=rfft(datas,axis=-1)
+            phase*=tf
+            decal=irfft(phase,self.length,axis=-1)
+
+        if out is None:
+            return decal
+        out[...]=decal
+        return out
+
+# Auto-test if Python script launched from console ---------------------------
+if __name__ == '__main__':
+    import time
+    from fbonnardot.signalproc.circShift import circShift
+    print("Auto-test if Python script launched from console")
+    print("A signal is shifted 1000 times and compared to circShift")
+    print("(difference should be close to 0).")
+
+    a=np.random.randn(256)
+    shifts=np.random.randn(1000)*10
+    shifter=FractionalShifter(len(a))
+
+    start=time.time()
+    for sht in shifts:
+        decal=circShift(a,sht,True)
+    print("circShift                     :",time.time()-start,"s")
+
+    start=time.time()
+    for sht in shifts:
+        decal2=shifter.shift(a,sht)
+    print("FractionalShifter (1 by 1)    :",time.time()-start,"s")
+
+    start=time.time()
+    decals=shifter.shift(a,shifts)
+    print("FractionalShifter (all at once):",time.time()-start,"s")
+    print("Difference :",np.max(np.abs(decals[-1]-decal)),np.max(np.abs(decal2-decal)))
@@ -14,6 +14,16 @@ Details
 
 circShift
     Circular shift of datas (use a Fourier Transform if shift is not an integer).
+FractionalShifter
+    Repeated circular fractional shifts of signals of the same length
+FractionalDelay
+    Linear fractional delay (constant or time varying) of signals given by chunks.
+setFftBackend
+    Choose the FFT used by the package (scipy.fft with worker threads or numpy.fft).
+useFftBackend
+    Use an FFT backend in a with block.
+resamplePeriod
+    Resample signals so that a non integer period becomes an integer number of samples.
 
 Note
 ----
@@ -52,8 +62,17 @@ __email__ = "frederic.bonnardot@univ-st-etienne.fr"
 __status__ = "Prototype"
 
 __all__ = [
-        'circShift'
+        'circShift',
+        'FractionalShifter',
+        'FractionalDelay',
+        'setFftBackend',
+        'useFftBackend',
+        'resamplePeriod'
 ]
 
 from .circShift import circShift
+from .FractionalShifter import FractionalShifter
+from .FractionalDelay import FractionalDelay
+from .fftBackend import setFftBackend,useFftBackend
+from .resamplePeriod import resamplePeriod
 
@@ -27,6 +27,7 @@ If you change or adapt this function, change its name (for example add your
 """
 
 import numpy             as np                 # matrix management
+from fbonnardot.signalproc.FractionalShifter import FractionalShifter
 
 def circShift (datas,shift,forceft=False):
     """
@@ -51,7 +52,11 @@ def circShift (datas,shift,forceft=False):
     
     Note
     ----
-    The computing are faster if the number of samples are in the form of :math:`2^n` with n integer.
+    * The computing are faster if the number of samples are in the form of :math:`2^n` with n integer.
+    * All the signals with a non integer shift are shifted with one FFT along
+      the last axis (real FFT for real datas) and one inverse FFT.
+    * Use FractionalShifter when many signals of the same length are shifted
+      one after the other.
 
     Examples
     --------
@@ -81,69 +86,44 @@ def circShift (datas,shift,forceft=False):
     # Modifications         : Saturday 2 February 2019 (Translation to Python 3.6)
     #                         Thursday 6 February 2919 (Docstring in NumPy format and change forceft to bool)
     #                         Wednesday 1st April 2020 (Docstrings and auto-test)
-    # Version               : 1.1 i
+    #                         Friday 16 October 2026 (One FFT for all signals, complex datas kept)
+    #                         Friday 16 October 2026 (Fourier Transform shift done by FractionalShifter)
+    # Version               : 1.3 i
 
     # Check parameters
     if type(datas) is not np.ndarray:
         raise ValueError("datas should be numpy arrays")
-    
-    if datas.ndim==1:
-        decal=circShift(np.array([datas]),shift,forceft)
-        return decal[0]
-    else:
-         li,col=datas.shape
-    
-    if np.isscalar(shift):
-        shift=np.ones(li)*shift
-  
-    if len(shift)!=li:
+
+    col=datas.shape[-1]
+    shift=np.asarray(shift,dtype=float)
+    if datas.ndim==1 and shift.size==1:
+        shift=np.reshape(shift,())
+    try:
+        shift=np.broadcast_to(shift,datas.shape[:-1])
+    except ValueError:
         raise ValueError("If shift is a vector it must have its size equal to signals numbers.")
-     
-    decal=np.zeros(datas.shape)
-        
-    # Pre computing for Fourier Transform
-    halfcol=col//2
-    if col & 1==0:
-        # Even samples number
-        # ex. 10 => f=[0 1 2 3 4 5 -4 -3 -2 -1]
-        f=np.concatenate((np.arange(0,halfcol+1),np.arange(-halfcol+1,0)))/col
-    else:
-        # Odd samples number
-        # ex.  9 => f=[0 1 2 3 4 -4 -3 -2 -1]
-        f=np.concatenate((np.arange(0,halfcol+1),np.arange(-halfcol,0)))/col
-    
-    # Pour each signal (i.e. line)
-    for index in range(li):
-        sht=shift[index]
-        # Two case :
-        if sht==np.floor (sht) and forceft==False:
-            # Integer shift
-            # Replace a negative shift by a positive shift
-            while sht<0:
-                sht=sht+col
-            # Set sht<col
-            sht=int(sht % col)
-            # Shift
-            decal[index,sht:col]=datas[index,0:(col-sht)]
-            decal[index,0:sht]  =datas[index,(col-sht):col]
-        else:
-            # Real shift => use Fourier Transform
-            # Use FT [s (t-tau)]=TFT[s (t)].e^[-2.i.pi.f.tau]
-            #   with phasis=e^[-2.i.pi.f.tau]
-            # Compute FT
-            tf=np.fft.fft (datas[index,:])
-            # Compute phasis
-            phase=np.exp(-2j*np.pi*f*sht)
-            # Apply phase to FT
-            tf=tf*phase
-            # Compute inverse FT
-            # If datas is real,
-            if np.isreal(datas[index,0]):
-                # decal should be real
-                decal[index,:]=np.real(np.fft.ifft (tf))
-            else:
-                decal[index,:]=np.fft.ifft (tf)
-    
+
+    # Complex datas stay complex
+    decal=np.zeros(datas.shape,dtype=np.result_type(datas,float))
+
+    # 1 signal per line (views)
+    datas2=np.reshape(datas,(-1,col))
+    decal2=np.reshape(decal,(-1,col))
+    shift=np.reshape(shift,-1)
+
+    # Integer shifts : decal[t]=datas[(t-shift) % col]
+    integer=np.logical_and(shift==np.floor(shift),not forceft)
+    if np.any(integer):
+        index=(np.arange(col)-shift[integer,np.newaxis].astype(int)) % col
+        decal2[integer]=np.take_along_axis(datas2[integer],index,-1)
+
+    # Real shifts => use Fourier Transform for all these signals at once
+    # Use FT [s (t-tau)]=TFT[s (t)].e^[-2.i.pi.f.tau]
+    real=np.logical_not(integer)
+    if np.any(real):
+        shifter=FractionalShifter(col,decal.dtype)
+        decal2[real]=shifter.shift(datas2[real],shift[real])
+
     return decal
 
 # Auto-test if Python script launched from console ---------------------------
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 16 22:04:51 2026
+
+@author: Frédéric BONNARDOT, AGPL-3.0-or-later license
+(c) Frédéric BONNARDOT, 2001-2026
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+This code is given as is without warranty of any kind.
+In no event shall the authors or copyright holder be liable for any claim
+                                                   damages or other liability.
+
+If you change or adapt this function, change its name (for example add your
+                                                       initial after the name)
+"""
+
+import threading                         # setting of each thread
+import numpy as np                       # matrix management
+import scipy.fft as spfft                # FFT with worker threads
+
+# Backend ('scipy' or 'numpy') and number of worker threads of all the threads
+config={'backend':'scipy','workers':None}
+# Setting of the current thread inside a useFftBackend block
+local=threading.local()
+
+def setFftBackend(backend=None,workers=None):
+    """
+    Choose the FFT used by the functions of the package (in all the threads,
+    except inside a useFftBackend block).
+
+    Parameters
+    ----------
+    backend : str, optional
+        'scipy' (scipy.fft, worker threads) or 'numpy' (numpy.fft)
+        optional, None by default ('scipy')
+
+    workers : int, optional
+        number of threads of scipy.fft (-1 : all the processors)
+        optional, None by default (1 thread)
+
+    Returns
+    -------
+    old : tuple
+        previous (backend,workers)
+
+    Example
+    -------
+    >>> import fbonnardot as fb
+    >>> fb.setFftBackend('scipy',workers=-1)
+    """
+    backend=checkBackend(backend)
+    old=(config['backend'],config['workers'])
+    config['backend']=backend
+    config['workers']=workers
+    return old
+
+def checkBackend(backend):
+    """
+    Check the name of a backend (None : 'scipy')
+    """
+    backend='scipy' if backend is None else backend
+    if backend not in ('scipy','numpy'):
+        raise ValueError("backend must be 'scipy' or 'numpy'.")
+    return backend
+
+def currentBackend():
+    """
+    (backend,workers) used by the current thread
+    """
+    setting=getattr(local,'setting',None)
+    return (config['backend'],config['workers']) if setting is None else setting
+
+class useFftBackend:
+    """
+    Use an FFT backend in a with block (the previous one is restored after).
+
+    The setting only applies to the thread running the block : threads
+    (ThreadPoolExecutor, ...) can use different backends at the same time.
+
+    Example
+    -------
+    >>> import fbonnardot as fb; import numpy as np
+    >>> with fb.useFftBackend(workers=4):
+    >>>     decal=fb.circShift(np.random.randn(16,100003),0.5)
+    """
+    # Creation      : Friday 16 October 2026
+    # Modifications : Friday 16 October 2026 (setting local to the thread)
+    # Version       : 1.1 i
+
+    def __init__(self,backend=None,workers=None):
+        """
+        Parameters
+        ----------
+        backend : str, optional
+            'scipy' or 'numpy'
+            optional, None by default ('scipy')
+        workers : int, optional
+            number of threads of scipy.fft
+            optional, None by default (1 thread)
+        """
+        self.backend=checkBackend(backend)
+        self.workers=workers
+
+    def __enter__(self):
+        self.old=getattr(local,'setting',None)
+        local.setting=(self.backend,self.workers)
+        return self
+
+    def __exit__(self,*args):
+        local.setting=self.old
+        return False
+
+def fft(x,n=None,axis=-1):
+    """
+    Fourier transform of x along axis (see numpy.fft.fft)
+    """
+    backend,workers=currentBackend()
+    if backend=='numpy':
+        return np.fft.fft(x,n,axis=axis)
+    return spfft.fft(x,n,axis=axis,workers=workers)
+
+def ifft(x,n=None,axis=-1):
+    """
+    Inverse Fourier transform of x along axis (see numpy.fft.ifft)
+    """
+    backend,workers=currentBackend()
+    if backend=='numpy':
+        return np.fft.ifft(x,n,axis=axis)
+    return spfft.ifft(x,n,axis=axis,workers=workers)
+
+def rfft(x,n=None,axis=-1):
+    """
+    Fourier transform of the real signal x along axis (positive frequencies only)
+    """
+    backend,workers=currentBackend()
+    if backend=='numpy':
+        return np.fft.rfft(x,n,axis=axis)
+    return spfft.rfft(x,n,axis=axis,workers=workers)
+
+def irfft(x,n=None,axis=-1):
+    """
+    Inverse of rfft (n : length of the real signal)
+    """
+    backend,workers=currentBackend()
+    if backend=='numpy':
+        return np.fft.irfft(x,n,axis=axis)
+    return spfft.irfft(x,n,axis=axis,workers=workers)
+
+def nextFastLen(n,real=False):
+    """
+    Smallest length >=n computed quickly by the FFT (to pad the signals when
+    the transform is not circular)
+    """
+    return spfft.next_fast_len(int(n),real)
+
+# Auto-test if Python script launched from console ---------------------------
+if __name__ == '__main__':
+    import time
+    print("Auto-test if Python script launched from console")
+    print("FFT of 16 signals of prime length, padded length, with the numpy")
+    print("and scipy backends (differences should be close to 0).")
+
+    N=100003          # prime number
+    x=np.random.randn(16,N)
+    nfast=nextFastLen(N,True)
+    for backend,workers in (('numpy',None),('scipy',None),('scipy',-1)):
+        with useFftBackend(backend,workers):
+            start=time.time()
+            X=fft(x)
+            duration=time.time()-start
+            start=time.time()
+            Xr=rfft(x,nfast)
+            print(backend,workers,": fft %.3f s, rfft padded to %d %.3f s" % (duration,nfast,time.time()-start),
+                  "difference :",np.max(np.abs(X-np.fft.fft(x))))
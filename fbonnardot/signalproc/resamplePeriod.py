@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 16 13:40:51 2026
+
+@author: Frédéric BONNARDOT, AGPL-3.0-or-later license
+(c) Frédéric BONNARDOT, 2001-2026
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+This code is given as is without warranty of any kind.
+In no event shall the authors or copyright holder be liable for any claim
+                                                   damages or other liability.
+
+If you change or adapt this function, change its name (for example add your
+                                                       initial after the name)
+"""
+
+import numpy as np                       # matrix management
+import scipy.signal as sigp              # signal processing
+import scipy.interpolate as interp       # interpolation
+from fractions import Fraction           # rational approximation
+
+def resamplePeriod (datas,period,method='poly',chunkSize=2**20):
+    """
+    Resample signals so that a non integer period becomes an integer number of samples.
+
+    The new sampling period is step=period/ceil(period) (in input samples),
+    so one period of the resampled signal contains ceil(period) samples.
+
+    Parameters
+    ----------
+    datas : np.array vector or matrix (nb_sig x sig_len) 1 signal=1 row
+        signals to resample
+
+    period : float
+        period (in samples) of the signals
+
+    method : str, optional
+        resampling method
+            - 'poly'  : rational polyphase filter (scipy.signal.resample_poly)
+                        processed by chunks with overlap
+            - 'cubic' : cubic interpolation of the whole signal (interp1d)
+        optional, 'poly' by default
+
+    chunkSize : int, optional
+        approximative number of input samples processed at once by 'poly'
+        optional, 2**20 by default
+
+    Returns
+    -------
+    resampled : np.array
+        resampled signals, sample m is at the position m*step of the input
+
+    blocSize : int
+        number of samples of one period after resampling (ceil(period))
+
+    step : float
+        new sampling period in input samples (used for 'poly' it is the rational
+        approximation up/down of period/ceil(period))
+
+    Note
+    ----
+    * The rational approximation of 'poly' is chosen so that the position
+      error at the end of the signal is lower than 1/100 sample.
+    * The first and last few samples are affected by border effects.
+
+    Example
+    -------
+    >>> import fbonnardot as fb; import numpy as np
+    >>> period=127.4; sig=np.sin(2*np.pi*np.arange(int(period*100))/period)
+    >>> resampled,blocSize,step=fb.resamplePeriod(sig,period)
+    >>> sav,nbBlocs=fb.syncAv(resampled,blocSize)
+    """
+
+    # Creation              : Friday 16 October 2026
+    # Modifications         : Friday 16 October 2026 (Integer period returned unchanged)
+    # Version               : 1.1 i
+
+    if period<=0:
+        raise ValueError('A period must be strictly positive.')
+
+    datas=np.asarray(datas)
+    col=datas.shape[-1]
+    blocSize=int(np.ceil(period))
+    step=period/blocSize
+
+    if method=='cubic':
+        ifunc=interp.interp1d(np.arange(col),datas,kind='cubic',axis=-1)
+        return ifunc(np.arange(0,col-1,step)),blocSize,step
+
+    if method!='poly':
+        raise ValueError('Illegal value for method.')
+
+    # step=down/up with a position error < 1/100 sample at the end of the signal
+    for maxden in (10**2,10**3,10**4,10**5):
+        frac=Fraction(step).limit_denominator(maxden)
+        if abs(frac-Fraction(step))*col/step<0.01:
+            break
+    down,up=frac.numerator,frac.denominator
+
+    # Integer period : nothing to resample
+    if up==down:
+        return datas,blocSize,1.0
+
+    # Number of output samples (positions <= col-1)
+    nbOut=(col-1)*up//down+1
+
+    # Low pass filter designed once for all chunks (twice longer than the
+    # resample_poly default for a better accuracy near the Nyquist frequency)
+    maxRate=max(up,down)
+    halfLen=20*maxRate
+    h=sigp.firwin(2*halfLen+1,1/maxRate,window=('kaiser',8.0))
+
+    # Chunks start at a multiple of down to begin on an output sample
+    # and are extended by a margin larger than the filter half length
+    chunk=max(1,chunkSize//down)*down
+    margin=-(-(halfLen//up+2)//down)*down
+
+    if chunk>=col:
+        resampled=sigp.resample_poly(datas,up,down,axis=-1,window=h,padtype='line')
+        return resampled[...,0:nbOut],blocSize,down/up
+
+    resampled=np.zeros(datas.shape[:-1]+(nbOut,),dtype=np.result_type(datas,float))
+    for start in range(0,col,chunk):
+        first=max(0,start-margin)
+        last=min(col,start+chunk+margin)
+        part=sigp.resample_poly(datas[...,first:last],up,down,axis=-1,window=h,padtype='line')
+        # Output samples associated to [start;start+chunk[
+        outStart=start*up//down
+        outStop=min(nbOut,(start+chunk)*up//down)
+        skip=(start-first)*up//down
+        resampled[...,outStart:outStop]=part[...,skip:skip+outStop-outStart]
+
+    return resampled,blocSize,down/up
+
+# Auto-test if Python script launched from console ---------------------------
+if __name__ == '__main__':
+    import time
+    print("Auto-test if Python script launched from console")
+    print("Benchmark of the resampling methods (speed and accuracy).")
+    print("The signal is a sum of sines so the exact resampled values are known.")
+
+    period=127.4
+    freqs=np.array([1,3,7,20])/period
+    for N in (10**5,10**6,10**7):
+        t=np.arange(N)
+        sig=np.sum(np.sin(2*np.pi*freqs[:,np.newaxis]*t),0)
+        for method in ('cubic','poly'):
+            start=time.time()
+            resampled,blocSize,step=resamplePeriod(sig,period,method)
+            duration=time.time()-start
+            tr=np.arange(np.size(resampled))*step
+            exact=np.sum(np.sin(2*np.pi*freqs[:,np.newaxis]*tr),0)
+            error=np.max(np.abs(resampled-exact)[100:-100])
+            print("N=%8d %-6s : %7.3f s   max error %.2e" % (N,method,duration,error))
+
+    # Integer period (float or NumPy integer) : the datas are returned unchanged
+    sig=np.random.randn(2,1000)
+    for period in (128.0,np.int64(64)):
+        resampled,blocSize,step=resamplePeriod(sig,period)
+        print("Period",repr(period),": blocSize",blocSize,"step",step,"unchanged",np.array_equal(resampled,sig))
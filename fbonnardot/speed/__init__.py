@@ -15,6 +15,8 @@ Details
 demodAnalytic
     Retreive the phase and the frequency by using the analytic signal phase
     around a given frequency band.
+demodAnalyticChunks
+    Same as demodAnalytic chunk by chunk (generator) for long recordings.
 synchronisation2
     Synchronisation of data by using intercorrelation or an amplitude based detection.
 
@@ -56,8 +58,10 @@ __status__ = "Prototype"
 
 __all__ = [
         'synchronisation2',
-        'demodAnalytic'
+        'demodAnalytic',
+        'demodAnalyticChunks'
 ]
 
 from .demodAnalytic    import demodAnalytic
+from .demodAnalyticChunks import demodAnalyticChunks
 from .synchronisation2 import synchronisation2
\ No newline at end of file
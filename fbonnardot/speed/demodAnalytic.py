@@ -28,18 +28,19 @@ If you change or adapt this function, change its name (for example add your
 """
 
 import numpy as np                       # matrix management
-import matplotlib.pyplot as plt          # plots
-import matplotlib.widgets as wdg         # plots widgets
+import scipy.interpolate as interpolate  # interpolation of the zoomed phase
+import scipy.signal as sigp              # Savitzky-Golay derivative
+from fbonnardot.signalproc.fftBackend import rfft,ifft,nextFastLen
 
-def demodAnalytic (signal,fdemod='interactive',method='diff'):
+def demodAnalytic (signal,fdemod='interactive',method='diff',zoom=False,interp=True,axis=-1,shared=True,nlag=8,pad=False):
     """
     Retreive the phase and the frequency by using the analytic signal phase
     around a given frequency band.
 
     Parameters
     ----------
-    signal : vector
-        signal
+    signal : vector or np.array (nb_chan x sig_len)
+        signal or signals of each channel (along axis)
         
     fdemod : str or vector, optional
         Can be a vector of 2 frequencies or a string :
@@ -47,8 +48,10 @@ def demodAnalytic (signal,fdemod='interactive',method='diff'):
             * String version:
                 * 'interactive' : Display the Fourier Transform of r_signal and ask the user for the bands.
                 * 'auto'        : Let the function choose the filter (can be only use for tacho signal and not working in all case !!!)
+                                  matplotlib is not used (batch processing).
      
             * Vector version : a 2 elements vector containing the low and high normalized frequency for extracting the speed information.
+              or a matrix (nb_chan x 2) with the band of each channel.
                       
         Optional, 'interactive' by default.
               
@@ -66,20 +69,62 @@ def demodAnalytic (signal,fdemod='interactive',method='diff'):
                 (come from instfreq of Toolbox Temps Fréquence)
                 
                 approximation freq(1)=freq(2)
+
+            * 'multilag' :
+                freq(n)=sum_k k.phase(n+k)/(2*pi*sum_k k^2) for k=-nlag..nlag
+                
+                least square slope of the unwrapped phase (smoothed phase
+                differences of lags 1 to nlag, Savitzky-Golay derivative)
                   
         Optionnal, 'diff' by default
 
+    zoom : bool, optional
+        if True, the band is shifted to the baseband and the analytic signal
+        is decimated by a factor step set by the bandwidth (the phase is
+        unwrapped on the decimated samples 0, step, 2*step, ...)
+        optional, False by default
+
+    interp : bool, optional
+        if True, the phase of the decimated samples is interpolated back
+        (cubic spline) to all the samples
+        optional, True by default (used only if zoom is True)
+
+    axis : int, optional
+        axis of the time for multi-channel signals
+        optional, -1 by default
+
+    shared : bool, optional
+        with fdemod='auto', if True the band is chosen on the mean spectrum of
+        the channels and used for all of them, else 1 band per channel
+        ('interactive' always uses the mean spectrum)
+        optional, True by default
+
+    nlag : int, optional
+        maximum lag of the 'multilag' method (the signals must contain at
+        least 2*nlag+1 samples)
+        optional, 8 by default
+
+    pad : bool, optional
+        if True, the signals are padded with zeros to a length computed
+        quickly by the FFT (much faster for prime lengths, but the results
+        change : about 5e-4 inside the signal and more near the borders)
+        optional, False by default (always True if zoom is True)
+
     Returns
     -------
-    freq : vector
+    freq : vector or np.array (same shape as signal)
         instantaneous frequency
         
-    phase : vector
+    phase : vector or np.array (same shape as signal)
         instantaneous phase
         
-    fdemod : vector
+    fdemod : vector or np.array (nb_chan x 2)
         value of fdemod (useful if fdemod='auto' or 'interactive')
 
+    step : int, optional
+        decimation factor (freq and phase are given for the samples
+        0, step, 2*step, ...), returned only if zoom is True and interp False
+
     Example
     -------
     
@@ -92,9 +137,16 @@ def demodAnalytic (signal,fdemod='interactive',method='diff'):
     >>> plt.subplot(2,1,1); plt.plot(t,sig)
     >>> plt.subplot(2,1,2); plt.plot(t,freq)
 
+    Zoom on the band (freq and phase of 1 sample over step) :
+
+    >>> freq,phase,__,step=fb.demodAnalytic(sig,[0.04,0.075],zoom=True,interp=False)
+    >>> plt.plot(t[::step][0:len(freq)],freq)
+
     Note
     ----
-    Be careful of border effects.
+    * Be careful of border effects.
+    * zoom always pads the signals to a fast FFT length (the decimation
+      factor step must divide the FFT length).
 
     """
 
@@ -102,56 +154,56 @@ def demodAnalytic (signal,fdemod='interactive',method='diff'):
     # Modifications         : Wednesday 2 January 2018 (Translation to Python 3.6)
     #                         Thursday 6 February 2019 (Docstring in NumPy format)
     #                         Wednesday 1st April 2020 (Auto-test)
-    # Version               : 2.1 i
+    #                         Friday 16 October 2026 (FFT backend of the package, real FFT
+    #                                                 padded to a fast length)
+    #                         Friday 16 October 2026 (autoBand : moving average by cumulative
+    #                                                 sum, matplotlib imported only if interactive)
+    #                         Friday 16 October 2026 (zoom : baseband decimation)
+    #                         Friday 16 October 2026 (multi-channel : axis and shared)
+    #                         Friday 16 October 2026 ('product' vectorized, 'multilag' method)
+    #                         Friday 16 October 2026 (padding to a fast length only if pad)
+    #                         Friday 16 October 2026 (length checked for 'multilag')
+    # Version               : 2.8 i
 
     # **************************************************************************
     # * Look at the parameters                                                 *
     # **************************************************************************
     
-    l=len (signal)
+    if method not in ('diff','product','multilag'):
+        raise ValueError('Illegal value for method')
+
+    signal=np.moveaxis(np.asarray(signal),axis,-1)
+    l=signal.shape[-1]
+    if method=='multilag' and (nlag<1 or l<2*nlag+1):
+        raise ValueError("method='multilag' needs nlag>=1 and at least 2*nlag+1 samples per signal")
     
     # Remove average to suppress DC peak
-    signal=signal-np.mean (signal)
+    signal=signal-np.mean (signal,axis=-1,keepdims=True)
     
     # **************************************************************************
     # * Try to find a band for demodulation                                    *
     # **************************************************************************
     if np.size(fdemod)==1:
-        tf=abs(np.fft.fft(signal))
-        maxi=max(tf)
-        mini=min(tf)
-    
-        #t=np.arange(len(tf))
-        t2=np.arange(len(tf)//2)
-        # -30 dB on smooth fft
-        posi=np.argmax(np.abs(tf[t2]))
-        maxi2=np.abs(tf[posi])
-        seuil=maxi2/10**(30/20)
-        lissage=100
-        tfl=np.zeros(len(tf))
-        tliss=np.arange(-lissage,lissage+1)
-        for index in np.arange(lissage,len(tf)//2-lissage):
-            tfl[index]=np.mean(np.abs(tf[index+tliss]))
-        dem=np.where(tfl<seuil)[0]
-        
-        if len(dem)<2:
-            fg=0
-            fd=len(tf)//2-1
+        if fdemod not in ('interactive','auto'):
+            raise ValueError("fdemod must be 'interactive', 'auto' or a vector of 2 frequencies")
+        # Positive frequencies only
+        tf=np.reshape(np.abs(rfft(signal)),(-1,l//2+1))
+        if fdemod=='interactive' or shared:
+            # Band shared by all the channels (mean of the spectra)
+            tf=np.mean(tf,axis=0)
+            fg,fd=autoBand(tf,l)
         else:
-            fg=np.where((dem-posi)<0)[0]
-            fd=np.where((dem-posi)>0)[0]
-            fg=dem[fg[-1]]
-            fd=dem[fd[0]]
-            # Bigger band
-            fen=fd-fg
-            marge=0.25
-            fg=np.floor(fg-fen*marge)/l
-            fd=np.ceil (fd+fen*marge)/l
+            # One band per channel
+            fg,fd=np.reshape(np.transpose([autoBand(row,l) for row in tf]),(2,)+signal.shape[:-1])
     
         if fdemod=='interactive':
             # interactive mode : ask the user for frequencies
+            import matplotlib.pyplot as plt          # plots
+            import matplotlib.widgets as wdg         # plots widgets
+            maxi=max(tf)
+            mini=min(tf)
             ff=plt.figure() 
-            plt.plot(np.linspace(0,1,len(tf)),tf)
+            plt.plot(np.linspace(0,(len(tf)-1)/l,len(tf)),tf)
             plt.title("Draw a rectangle and clic on right button to validate")
             # plt.plot(np.linspace(0,1,len(tfl)),tfl)
             plt.xlabel ('Normalized Frequency')
@@ -203,43 +255,148 @@ def demodAnalytic (signal,fdemod='interactive',method='diff'):
             #    fd=a
             plt.close(ff)
     
-        fdemod=[fg,fd]
+        fdemod=[fg,fd] if np.ndim(fg)==0 else np.stack((fg,fd),axis=-1)
     
-    fdemodl=np.round(np.array(fdemod)*l)
-    
-    # Filter + analytic signal
-    tf=np.fft.fft(signal)
-    tf[0:int(fdemodl[0])]=0
-    tf[int(fdemodl[1]):]=0
-    sa=np.fft.ifft(tf)
+    # Filter + analytic signal (only the positive frequencies of the band
+    # are kept), signals padded to a fast FFT length if asked
+    nfft=nextFastLen(l) if pad or zoom else l
+    fdemodl=np.round(np.asarray(fdemod)*nfft).astype(int)
+    if fdemodl.shape[-1]!=2:
+        raise ValueError('fdemod must contain 2 frequencies (for each channel)')
+    tf=rfft(signal,nfft)
+    # First and last+1 bins of the band of each channel
+    low=np.clip(np.broadcast_to(fdemodl[...,0],signal.shape[:-1]),0,tf.shape[-1])[...,np.newaxis]
+    high=np.clip(np.broadcast_to(fdemodl[...,1],signal.shape[:-1]),0,tf.shape[-1])[...,np.newaxis]
+
+    if zoom:
+        if method!='diff':
+            raise ValueError("zoom can only be used with method='diff'")
+        # Band shifted to the baseband (center kc at 0) and 1 sample over step
+        kc=(low+high)//2
+        step=zoomFactor(nfft,int(np.max(high-low)))
+        M=nfft//step
+        # Bins kc-M/2 to kc+M/2-1 in the order of the FFT of length M
+        k=kc+np.round(np.fft.fftfreq(M)*M).astype(int)
+        tfz=np.where((k>=low) & (k<high),np.take_along_axis(tf,np.clip(k,0,tf.shape[-1]-1),axis=-1),0)
+        z=ifft(tfz)[...,0:min(M,(l-1)//step+2)]
+        # Phase of the analytic signal : baseband phase + 2.pi.kc/nfft.n
+        ndec=np.arange(z.shape[-1])
+        phi=np.unwrap(np.angle(z))+2*np.pi*kc*ndec/M
+        if interp:
+            phi=interpolate.CubicSpline(ndec*step,phi,axis=-1)(np.arange(l))
+        else:
+            # Decimated samples of the signal only
+            phi=phi[...,0:(l-1)//step+1]
+            freq=np.diff(phi)/(2*np.pi*step)
+            freq=np.concatenate((freq,freq[...,-1:]),axis=-1)
+            return np.moveaxis(freq,-1,axis),np.moveaxis(phi,-1,axis),fdemod,step
+        freq=np.diff(phi)/(2*np.pi)
+        freq=np.concatenate((freq,freq[...,-1:]),axis=-1)
+        return np.moveaxis(freq,-1,axis),np.moveaxis(phi,-1,axis),fdemod
+
+    # Negative frequencies set to 0 by the padding of the inverse FFT
+    k=np.arange(tf.shape[-1])
+    tf*=(k>=low) & (k<high)
+    sa=ifft(tf,nfft)[...,0:l]
     
-    # Demodulation
+    # Demodulation (unwrapped channel by channel : smaller temporary arrays)
+    phase=np.empty(sa.shape)
+    for index in np.ndindex(sa.shape[:-1]):
+        phase[index]=np.unwrap(np.angle(sa[index]))
+
     if method=='diff':
-        phi=np.unwrap(np.angle(sa))
-        freq=np.diff(phi)/(2*np.pi)
+        freq=np.diff(phase)/(2*np.pi)
+        freq=np.concatenate((freq,freq[...,-1:]),axis=-1)
     elif method=='product':
-        phi=np.unwrap(np.angle(sa))
-        n=np.arange(1,len(signal)-1)
-        freq[n]=(np.angle(-sa[n+1]*np.conj(sa[n-1]))+np.pi)/4/np.pi
-        freq[0]=freq[1]
+        # n=1..l-2, approximation freq(0)=freq(1) and freq(l-1)=freq(l-2)
+        freq=(np.angle(-sa[...,2:]*np.conj(sa[...,0:-2]))+np.pi)/(4*np.pi)
+        freq=np.concatenate((freq[...,0:1],freq,freq[...,-1:]),axis=-1)
     else:
-        raise ValueError('Illegal value for method')
+        # Least square slope of the phase on 2*nlag+1 samples
+        freq=sigp.savgol_filter(phase,2*nlag+1,1,deriv=1,axis=-1)/(2*np.pi)
     
-    phase=phi
-    freq=np.append(freq,freq[-1])
-    
-    return freq,phase,fdemod
+    return np.moveaxis(freq,-1,axis),np.moveaxis(phase,-1,axis),fdemod
+
+def zoomFactor(nfft,bandwidth):
+    """
+    Biggest divisor step of nfft such as nfft/step>=2*bandwidth (bins) : the
+    decimated analytic signal keeps the band with an oversampling of 2.
+    """
+    step=max(1,nfft//max(1,2*bandwidth))
+    while nfft % step!=0:
+        step-=1
+    return step
+
+def autoBand(tf,l,lissage=100):
+    """
+    Band around the highest peak of the spectrum where the smoothed spectrum
+    is higher than the peak -30 dB (used by fdemod='auto').
+
+    Parameters
+    ----------
+    tf : vector
+        modulus of the Fourier transform (positive frequencies, rfft)
+    l : int
+        length of the signal
+    lissage : int, optional
+        half length of the moving average
+        optional, 100 by default
+
+    Returns
+    -------
+    fg,fd : float
+        low and high normalized frequencies of the band (25 % margin)
+    """
+    half=l//2
+    posi=np.argmax(tf[0:half])
+    seuil=tf[posi]/10**(30/20)
+
+    # Moving average of 2*lissage+1 samples (0 near the borders)
+    tfl=np.zeros(len(tf))
+    if half-lissage>lissage:
+        cum=np.concatenate(([0],np.cumsum(tf[0:half])))
+        tfl[lissage:half-lissage]=(cum[2*lissage+1:half+1]-cum[0:half-2*lissage])/(2*lissage+1)
+
+    dem=np.flatnonzero(tfl<seuil)
+    below=dem[dem<posi]
+    above=dem[dem>posi]
+    if len(below)==0 or len(above)==0:
+        return 0,(half-1)/l
+
+    fg=below[-1]
+    fd=above[0]
+    # Bigger band
+    fen=fd-fg
+    marge=0.25
+    return np.floor(fg-fen*marge)/l,np.ceil(fd+fen*marge)/l
 
 # Auto-test if Python script launched from console ---------------------------
 if __name__ == '__main__':
+    import time
+    import matplotlib.pyplot as plt
     print("Auto-test if Python script launched from console")
     print("You should see a graph with a two plateau.")
     print("Draw a rectangle on the left one and right click.")
-    print("Another graph with a ramp should appear.")
+    print("Another graph with a ramp should appear and the duration of")
+    print("fdemod='auto' on 10^7 samples is printed.")
+    print("Then the methods are compared on a noisy chirp (speed vs accuracy).")
     t=np.arange(0,10,0.001)
     phi=2*np.pi*(50*t+2*t**2); sig=np.sin(phi)
     freq,phase,__=demodAnalytic(sig)
+    start=time.time()
+    __,__,band=demodAnalytic(np.sin(2*np.pi*(0.1*np.arange(10**7)+np.random.randn(10**7)*0.01)),'auto')
+    print("fdemod='auto' on 10^7 samples : %.2f s, band" % (time.time()-start),band)
     plt.figure();
     plt.subplot(2,1,1); plt.plot(t,sig)
     plt.subplot(2,1,2); plt.plot(t,freq)
-    
\ No newline at end of file
+
+    # Benchmark of the methods on a chirp from 0.1 to 0.2 (SNR 20 dB)
+    N=10**6; n=np.arange(N)
+    chirp=np.sin(2*np.pi*(0.1*n+0.05*n**2/N))+0.1*np.random.randn(N)
+    true=0.1+0.1*n/N
+    for method in ('diff','product','multilag'):
+        start=time.time()
+        freq,__,__=demodAnalytic(chirp,[0.05,0.25],method)
+        duration=time.time()-start
+        error=np.sqrt(np.mean((freq-true)[1000:-1000]**2))
+        print("%-8s : %.3f s, RMS error %.2e" % (method,duration,error))
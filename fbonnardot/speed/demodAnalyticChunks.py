@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 16 22:41:09 2026
+
+@author: Frédéric BONNARDOT, AGPL-3.0-or-later license
+(c) Frédéric BONNARDOT, 2001-2026
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+This code is given as is without warranty of any kind.
+In no event shall the authors or copyright holder be liable for any claim
+                                                   damages or other liability.
+
+If you change or adapt this function, change its name (for example add your
+                                                       initial after the name)
+"""
+
+import itertools
+import numpy as np                       # matrix management
+from fbonnardot.signalproc.fftBackend import fft,ifft,nextFastLen
+
+def demodAnalyticChunks (datas,fdemod,method='diff',taps=1025,beta=8.0,chunkSize=2**16):
+    """
+    Retreive the phase and the frequency by using the analytic signal phase
+    around a given frequency band, chunk by chunk (generator).
+
+    The analytic signal is computed by a complex band-pass FIR filter
+    (overlap-save) keeping only the positive frequencies of the band. The
+    phase is unwrapped continuously from one chunk to the next one.
+
+    Parameters
+    ----------
+    datas : iterable, np.array, np.memmap or str
+        signal :
+            - iterable (generator, list, ...) : successive chunks (vectors)
+            - np.array or np.memmap : vector read by chunks of chunkSize samples
+            - str : name of a .npy file (opened with mmap_mode='r')
+
+    fdemod : vector
+        low and high normalized frequencies of the band (see demodAnalytic)
+
+    method : str, optional
+        Method for estimation of the instantaneous frequency :
+
+            * 'diff' : freq(n)=[phase(n+1)-phase(n)]/(2*pi)
+
+        Optional, 'diff' by default
+
+    taps : int, optional
+        length of the FIR filter (odd), transition band of about 5/taps
+        optional, 1025 by default
+
+    beta : float, optional
+        parameter of the Kaiser window of the filter
+        optional, 8.0 by default
+
+    chunkSize : int, optional
+        number of samples of the blocs filtered at once
+        optional, 2**16 by default
+
+    Returns
+    -------
+    generator of (freq,phase) : vectors
+        instantaneous frequency and unwrapped phase of the next samples
+        (the concatenation of the vectors has the length of the signal)
+
+    Note
+    ----
+    * The filter is zero-phase (the output is delayed by (taps-1)/2 samples
+      inside the generator and zeros are added at the end of the signal).
+    * Unlike demodAnalytic, the mean is not removed : use fdemod[0]>0.
+
+    Example
+    -------
+    >>> import fbonnardot as fb; import numpy as np
+    >>> N=10**7; n=np.arange(N)
+    >>> sig=np.sin(2*np.pi*(0.1*n+1e-9*n**2))
+    >>> np.save('record.npy',sig)
+    >>> freq=np.concatenate([f for f,phi in fb.demodAnalyticChunks('record.npy',[0.05,0.15])])
+    """
+
+    # Creation              : Friday 16 October 2026
+    # Version               : 1.0 i
+
+    if method!='diff':
+        raise ValueError('Illegal value for method')
+    if taps<1 or taps % 2==0:
+        raise ValueError('taps must be an odd integer.')
+
+    # Open the datas
+    if isinstance(datas,str):
+        datas=np.load(datas,mmap_mode='r')
+    if isinstance(datas,np.ndarray):
+        if datas.ndim!=1:
+            raise ValueError('datas must be a vector.')
+        signal=datas
+        datas=(signal[start:start+chunkSize] for start in range(0,len(signal),chunkSize))
+
+    # Complex band-pass filter : h(m)=w(m).(e^(2i.pi.f2.m)-e^(2i.pi.f1.m))/(2i.pi.m)
+    f1,f2=fdemod
+    delay=(taps-1)//2
+    m=np.arange(taps)-delay
+    h=np.where(m==0,f2-f1,(np.exp(2j*np.pi*f2*m)-np.exp(2j*np.pi*f1*m))/(2j*np.pi*np.where(m==0,1,m)))
+    h=h*np.kaiser(taps,beta)
+
+    nfft=nextFastLen(chunkSize+taps-1)
+    block=nfft-taps+1
+    H=fft(h,nfft)
+
+    hist=np.zeros(taps-1)    # last taps-1 samples of the signal
+    skip=delay               # outputs before the first sample of the signal
+    lastAngle=None           # angle and unwrapped phase of the last sample
+    lastPhase=0
+    held=np.zeros(0)         # phase of the sample waiting for the next one
+    freq=np.zeros(1)
+
+    # delay zeros at the end to get the last samples
+    for chunk in itertools.chain(datas,[np.zeros(delay)]):
+        chunk=np.asarray(chunk,dtype=float)
+        for start in range(0,len(chunk),block):
+            # Overlap-save
+            buf=np.concatenate((hist,chunk[start:start+block]))
+            sa=ifft(fft(buf,nfft)*H)[taps-1:len(buf)]
+            hist=buf[len(buf)-(taps-1):]
+            if skip>0:
+                nb=min(skip,len(sa))
+                sa=sa[nb:]
+                skip-=nb
+            if len(sa)==0:
+                continue
+
+            # Unwrapped phase (same as np.unwrap, continuous between blocs)
+            angle=np.angle(sa)
+            if lastAngle is None:
+                lastAngle=lastPhase=angle[0]
+            dphi=np.diff(np.concatenate(([lastAngle],angle)))
+            dphimod=np.mod(dphi+np.pi,2*np.pi)-np.pi
+            dphimod[(dphimod==-np.pi) & (dphi>0)]=np.pi
+            phi=lastPhase+np.cumsum(dphimod)
+            lastAngle=angle[-1]
+            lastPhase=phi[-1]
+
+            # freq(n) needs phase(n+1) : the last sample waits for the next bloc
+            phi=np.concatenate((held,phi))
+            held=phi[-1:]
+            if len(phi)>1:
+                freq=np.diff(phi)/(2*np.pi)
+                yield freq,phi[0:-1]
+
+    # Last sample : freq(N-1)=freq(N-2)
+    if len(held)>0:
+        yield freq[-1:],held
+
+# Auto-test if Python script launched from console ---------------------------
+if __name__ == '__main__':
+    import time
+    from fbonnardot.speed.demodAnalytic import demodAnalytic
+    print("Auto-test if Python script launched from console")
+    print("A chirp is demodulated chunk by chunk from a .npy file and compared")
+    print("to demodAnalytic (differences should be small far from the borders).")
+
+    import os, tempfile
+    N=2*10**6; n=np.arange(N)
+    sig=np.sin(2*np.pi*(0.1*n+2e-8*n**2))+0.01*np.random.randn(N)
+    name=os.path.join(tempfile.mkdtemp(),'record.npy')
+    np.save(name,sig)
+
+    start=time.time()
+    result=list(demodAnalyticChunks(name,[0.05,0.3]))
+    freq=np.concatenate([f for f,phi in result])
+    phase=np.concatenate([phi for f,phi in result])
+    print("demodAnalyticChunks : %.2f s" % (time.time()-start))
+
+    start=time.time()
+    freq2,phase2,__=demodAnalytic(sig,[0.05,0.3])
+    print("demodAnalytic       : %.2f s" % (time.time()-start))
+    print("Lengths :",len(freq),len(freq2))
+    print("Frequency difference :",np.max(np.abs(freq-freq2)[5000:-5000]))
+    phase_diff=(phase-phase2)[5000:-5000]
+    print("Phase difference     :",np.max(np.abs(phase_diff-np.mean(phase_diff))))
+    os.remove(name)
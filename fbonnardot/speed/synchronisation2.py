@@ -32,9 +32,11 @@ import scipy.signal      as sigp               # signal processing
 import scipy.interpolate as interp             # interpolation
 import matplotlib.pyplot as plt                # plot functions
 import fbonnardot.detection.peakDetection as peakDetection
-import fbonnardot.signalproc.circShift as circShift
+from fbonnardot.signalproc.FractionalShifter import FractionalShifter
+from fbonnardot.signalproc.fftBackend import rfft,irfft
 import fbonnardot.display.periodPlot as periodPlot
 import fbonnardot.display.supPlot as supPlot
+from fbonnardot.various.progressHook import progressStage
 
 def synchronisation2 (signal,period,method='maxCxyint',param=None,scaleopt='none',estsync=True,compens=False,graph=0):
     """
@@ -144,7 +146,11 @@ def synchronisation2 (signal,period,method='maxCxyint',param=None,scaleopt='none
     #                 Wednesday 27 February 2019 : circ option for correlation
     #                                              modulo period for graph=2
     #                 Wednesday 1st April 2020 (Auto-test)
-    # Version       : 1.1 i
+    #                 Friday 16 October 2026 (Progress reported to the hook of setProgressHook)
+    #                 Friday 16 October 2026 (Decimal part of the shifts done by a FractionalShifter)
+    #                 Friday 16 October 2026 (ceps : real FFT of the package backend, fast length)
+    #                 Friday 16 October 2026 (ceps : no padding, same cepstrum as version 1.1)
+    # Version       : 1.5 i
 
 
     # Check parameters
@@ -176,110 +182,110 @@ def synchronisation2 (signal,period,method='maxCxyint',param=None,scaleopt='none
         raise ValueError('Illegal value for scaleopt')
         
     # Estimation of shifts between each periods in the signal
-    progressBar(0,"1/2")
-    t=np.arange(period)   # signal[t] is compared to reference signal
-    offset=0
-    delta=[]              # List to store the estimated shifts
+    with progressStage('synchronisation2 1/2',len(signal)) as stage:
+        t=np.arange(period)   # signal[t] is compared to reference signal
+        offset=0
+        delta=[]              # List to store the estimated shifts
         
-    while t[-1]<len(signal):
-        # Compute correlation if necessary
-        if method in ('maxCxy','baryCxy','maxCxyint'):
-            if scaleopt=='circ':
-                correlation=sigp.correlate(reference,np.tile(signal[t],2),'valid')
-            else:
-                # https://stackoverflow.com/questions/43652911/python-normalizing-1d-cross-correlation
-                correlation=sigp.correlate(reference,signal[t],'full')/normCorr
+        while t[-1]<len(signal):
+            # Compute correlation if necessary
+            if method in ('maxCxy','baryCxy','maxCxyint'):
+                if scaleopt=='circ':
+                    correlation=sigp.correlate(reference,np.tile(signal[t],2),'valid')
+                else:
+                    # https://stackoverflow.com/questions/43652911/python-normalizing-1d-cross-correlation
+                    correlation=sigp.correlate(reference,signal[t],'full')/normCorr
             
           
-        # Lag estimation
-        if method=='maxCxy':
-            posmax=np.argmax (correlation)
-            delta.append(posmax-period+offset)
+            # Lag estimation
+            if method=='maxCxy':
+                posmax=np.argmax (correlation)
+                delta.append(posmax-period+offset)
            
-        elif method=='baryCxy':
-            weight=np.abs(correlation)
-            xi=np.arange(1,2*period)
-            barycenter=np.round (np.sum(weight*xi)/np.sum(weight))
-            delta.append(np.round(barycenter)-period+offset)
+            elif method=='baryCxy':
+                weight=np.abs(correlation)
+                xi=np.arange(1,2*period)
+                barycenter=np.round (np.sum(weight*xi)/np.sum(weight))
+                delta.append(np.round(barycenter)-period+offset)
            
-        elif method=='maxCxyint':
-            interpol=interp.interp1d(np.arange(len(correlation)),correlation,'cubic')
-            icorrelation=interpol(np.arange((len(correlation)-1)*10)/10)
-            posmax=np.argmax(icorrelation)/10
-            delta.append(posmax-period+offset)
+            elif method=='maxCxyint':
+                interpol=interp.interp1d(np.arange(len(correlation)),correlation,'cubic')
+                icorrelation=interpol(np.arange((len(correlation)-1)*10)/10)
+                posmax=np.argmax(icorrelation)/10
+                delta.append(posmax-period+offset)
 
-        elif method=='threshold':
-            #dec=min(period//2,t[0]) # To have + or - shifts use t-dec instead of t
-            dec=0
-            indice=np.where(signal[t-dec]>=param)[0]-dec
-            if len(indice)!=0:
-                delta.append(-indice[0]+offset)
-            else:
-                delta.append(0)
+            elif method=='threshold':
+                #dec=min(period//2,t[0]) # To have + or - shifts use t-dec instead of t
+                dec=0
+                indice=np.where(signal[t-dec]>=param)[0]-dec
+                if len(indice)!=0:
+                    delta.append(-indice[0]+offset)
+                else:
+                    delta.append(0)
            
-        elif method=='rthreshold':
-            #dec=min(period//2,t[0]) # To have + or - shifts use t-dec instead of t
-            dec=0
-            indice=np.where(np.logical_and(signal[t-dec+2]-signal[t-dec]>param[1]/2,signal[t-dec+1]>=param[0]))[0]-dec
-            if len(indice)!=0:
-                delta.append(-indice[0]+offset)
-            else:
-                delta.append(0)
+            elif method=='rthreshold':
+                #dec=min(period//2,t[0]) # To have + or - shifts use t-dec instead of t
+                dec=0
+                indice=np.where(np.logical_and(signal[t-dec+2]-signal[t-dec]>param[1]/2,signal[t-dec+1]>=param[0]))[0]-dec
+                if len(indice)!=0:
+                    delta.append(-indice[0]+offset)
+                else:
+                    delta.append(0)
            
-        elif method=='max':
-            #dec=min(period//2,t[0]) # To have + or - shifts use t-dec instead of t
-            dec=0 # no negative shifts
-            indice=np.argmax (signal[t-dec])
-            indice=indice-dec
-            delta.append(-indice+offset)
+            elif method=='max':
+                #dec=min(period//2,t[0]) # To have + or - shifts use t-dec instead of t
+                dec=0 # no negative shifts
+                indice=np.argmax (signal[t-dec])
+                indice=indice-dec
+                delta.append(-indice+offset)
            
-        elif method=='ceps':
-            prelev=np.concatenate((reference,signal[t],np.zeros(2*period)))
-            # cepstre=np.real(np.fft.ifft(np.log(np.abs(np.fft(prelev)))))
-            cepstre=np.real(np.fft.ifft(np.log(np.abs(np.fft.fft(sigp.correlate(prelev,prelev,'full')**2)))))
-            cepstre=cepstre[0:(len(cepstre)//2)]
-            cepstre[0:period//2+1]=0
-            position,amp=peakDetection(cepstre,'diffInterp',10,10,10)
-            position=np.array(position)
-            sel=np.argmin(abs(position-period))
-            position=position[sel]
-            delta.append(position-1-period+offset)
+            elif method=='ceps':
+                prelev=np.concatenate((reference,signal[t],np.zeros(2*period)))
+                # cepstre=np.real(np.fft.ifft(np.log(np.abs(np.fft(prelev)))))
+                # Real cepstrum (real FFT, no padding : same sampling of the log spectrum)
+                corr=sigp.correlate(prelev,prelev,'full')**2
+                cepstre=irfft(np.log(np.abs(rfft(corr))),len(corr))
+                cepstre=cepstre[0:(len(cepstre)//2)]
+                cepstre[0:period//2+1]=0
+                position,amp=peakDetection(cepstre,'diffInterp',10,10,10)
+                position=np.array(position)
+                sel=np.argmin(abs(position-period))
+                position=position[sel]
+                delta.append(position-1-period+offset)
        
-        # Slip compensation
-        if compens:
-            compensation=delta[-1]-offset
-            if abs(compensation)>1:
-                compensation=int (compensation)
-                t=t-compensation
-                offset=offset+compensation
-        else:
-            compensation=0
+            # Slip compensation
+            if compens:
+                compensation=delta[-1]-offset
+                if abs(compensation)>1:
+                    compensation=int (compensation)
+                    t=t-compensation
+                    offset=offset+compensation
+            else:
+                compensation=0
     
-        t=t+period
-       
-        progressBar(t[0]/len(signal),"1/2")
+            t=t+period
        
-    progressBar(-1,'')
+            stage.update(min(t[0],len(signal)))
     delta=np.array(delta)
 
     # Signal shifting
     #delta=delta-delta[0]  
     if estsync:
         delta2=delta-delta[0]
-        progressBar(0,"2/2")
         synchr=np.zeros((len(delta2),period))
+        shifter=FractionalShifter(period)
         t=np.arange(period)
-        for index in range(len(delta2)):
-            if (t[-1]-int(delta2[index]))<len(signal):
-                extrait=signal[t-int(delta2[index])]
-                # decdec is the decimal part of shifting
-                decdec=delta2[index]-int(delta2[index])
-                if decdec!=0:
-                    extrait=circShift (extrait,decdec)
-                synchr[index,:]=extrait[0:period]
-            t=t+period
-            progressBar(index/len(delta2),"2/2")
-        progressBar(-1,'')
+        with progressStage('synchronisation2 2/2',len(delta2)) as stage:
+            for index in range(len(delta2)):
+                if (t[-1]-int(delta2[index]))<len(signal):
+                    extrait=signal[t-int(delta2[index])]
+                    # decdec is the decimal part of shifting
+                    decdec=delta2[index]-int(delta2[index])
+                    if decdec!=0:
+                        extrait=shifter.shift(extrait,decdec)
+                    synchr[index,:]=extrait[0:period]
+                t=t+period
+                stage.update(index+1)
     else:
         synchr=None
     
@@ -320,23 +326,6 @@ def synchronisation2 (signal,period,method='maxCxyint',param=None,scaleopt='none
 
     return synchr,delta
     
-def progressBar(position,step):
-    """
-    Display a text progress bar
-    
-    Parameters
-    ----------
-    
-    position   : between 0 and 1
-                 otherwise suppress the bar
-    """
-    
-    if position>=0 and position<=1:
-        nb_done=int(np.ceil(position*50))
-        print("\rsynchro"+step+" : \u001b[44;1m"+">"*nb_done+"\u001b[0m\u001b[44m"+"-"*(50-nb_done)+"\u001b[0m",end='')
-    else:
-        print("\r"+" "*70+"\r\u001b[A")
-
 # Auto-test if Python script launched from console ---------------------------
 if __name__ == '__main__':
     print("Auto-test if Python script launched from console")
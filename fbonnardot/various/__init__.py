@@ -14,6 +14,12 @@ Details
 
 read_gpx
     Read a track from gps gpx file
+ProgressHook
+    Receives the progress and duration of the long computations (no-op by default)
+TerminalProgressHook
+    Progress bar in the terminal
+setProgressHook
+    Set the hook that receives the progress of the computations
 
 Note
 ----
@@ -52,7 +58,11 @@ __email__ = "frederic.bonnardot@univ-st-etienne.fr"
 __status__ = "Prototype"
 
 __all__ = [
-        'read_gpx'
+        'read_gpx',
+        'ProgressHook',
+        'TerminalProgressHook',
+        'setProgressHook'
 ]
 
 from .read_gpx import read_gpx
+from .progressHook import ProgressHook, TerminalProgressHook, setProgressHook
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 16 20:21:06 2026
+
+@author: Frédéric BONNARDOT, AGPL-3.0-or-later license
+(c) Frédéric BONNARDOT, 2001-2026
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+This code is given as is without warranty of any kind.
+In no event shall the authors or copyright holder be liable for any claim
+                                                   damages or other liability.
+
+If you change or adapt this function, change its name (for example add your
+                                                       initial after the name)
+"""
+
+import time
+
+class ProgressHook:
+    """
+    Receives the progress of the long computations of the package (does nothing).
+
+    Derive this class and give an instance to setProgressHook to display the
+    progress or to export the duration of each stage.
+
+    Example
+    -------
+    >>> import fbonnardot as fb
+    >>> class Timings(fb.ProgressHook):
+    >>>     def end(self,stage,duration,count):
+    >>>         print(stage,duration,'s',count,'items')
+    >>> fb.setProgressHook(Timings())
+
+    Note
+    ----
+    * The methods are called by the thread doing the computation.
+    * progress is called at each iteration : keep it fast.
+    """
+    # Creation      : Friday 16 October 2026
+    # Version       : 1.0 i
+
+    def start(self,stage,total):
+        """
+        A stage begins
+
+        Parameters
+        ----------
+        stage : str
+            name of the stage (for example 'cycloTimeCorr')
+        total : int
+            number of items of the stage (None if unknown)
+        """
+        pass
+
+    def progress(self,stage,done,total):
+        """
+        done items of the stage are processed
+        """
+        pass
+
+    def end(self,stage,duration,count):
+        """
+        The stage is finished
+
+        Parameters
+        ----------
+        stage : str
+            name of the stage
+        duration : float
+            wall time of the stage in s
+        count : int
+            number of items processed
+        """
+        pass
+
+class TerminalProgressHook(ProgressHook):
+    """
+    Text progress bar in the terminal (redrawn only when it changes).
+
+    Example
+    -------
+    >>> import fbonnardot as fb
+    >>> fb.setProgressHook(fb.TerminalProgressHook())
+    """
+    # Creation      : Friday 16 October 2026
+    # Version       : 1.0 i
+
+    def __init__(self,width=50):
+        self.width=width
+        self.drawn=None
+
+    def start(self,stage,total):
+        self.drawn=None
+        self.progress(stage,0,total)
+
+    def progress(self,stage,done,total):
+        if not total:
+            return
+        nb_done=int(-(-min(done,total)*self.width//total))
+        if nb_done!=self.drawn:
+            self.drawn=nb_done
+            print("\r"+stage+" : \u001b[44;1m"+">"*nb_done+"\u001b[0m\u001b[44m"+"-"*(self.width-nb_done)+"\u001b[0m",end='')
+
+    def end(self,stage,duration,count):
+        print("\r"+" "*(len(stage)+self.width+3)+"\r",end='')
+        self.drawn=None
+
+hook=ProgressHook()
+
+def setProgressHook(newHook=None):
+    """
+    Set the object that receives the progress of the computations.
+
+    Parameters
+    ----------
+    newHook : ProgressHook, optional
+        new hook
+        optional, None by default (no display)
+
+    Returns
+    -------
+    oldHook : ProgressHook
+        previous hook
+    """
+    global hook
+    oldHook=hook
+    hook=ProgressHook() if newHook is None else newHook
+    return oldHook
+
+class progressStage:
+    """
+    Stage of a computation reported to the current hook (used in a with block).
+
+    Example
+    -------
+    >>> with progressStage('peakSelection',len(pos)) as stage:
+    >>>     for n in range(len(pos)):
+    >>>         stage.update(n+1)
+    """
+    # Creation      : Friday 16 October 2026
+    # Version       : 1.0 i
+
+    def __init__(self,stage,total=None):
+        """
+        Parameters
+        ----------
+        stage : str
+            name of the stage (None : the stage is not reported)
+        total : int, optional
+            number of items of the stage
+            optional, None by default (unknown)
+        """
+        self.stage=stage
+        self.total=total
+        self.done=0
+
+    def __enter__(self):
+        self.hook=hook if self.stage is not None else ProgressHook()
+        self.begin=time.perf_counter()
+        self.hook.start(self.stage,self.total)
+        return self
+
+    def update(self,done):
+        """
+        done items processed since the beginning of the stage
+        """
+        self.done=done
+        self.hook.progress(self.stage,done,self.total)
+
+    def __exit__(self,*args):
+        self.hook.end(self.stage,time.perf_counter()-self.begin,self.done)
+        return False
+
+# Auto-test if Python script launched from console ---------------------------
+if __name__ == '__main__':
+    print("Auto-test if Python script launched from console")
+    print("A progress bar is displayed during 1 s, then the duration of")
+    print("the stage is printed.")
+
+    class Timings(TerminalProgressHook):
+        def end(self,stage,duration,count):
+            TerminalProgressHook.end(self,stage,duration,count)
+            print(stage,": %.2f s, %d items" % (duration,count))
+
+    setProgressHook(Timings())
+    with progressStage('test',100) as stage:
+        for n in range(100):
+            time.sleep(0.01)
+            stage.update(n+1)
+    setProgressHook()